@@ -7,10 +7,13 @@ import logging
 import platform
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from .event_types import Event
 
+if TYPE_CHECKING:
+    from ..platform.base import WindowHandle
+
 # Platform detection
 IS_WINDOWS = platform.system().lower() == "windows"
 IS_LINUX = platform.system().lower() == "linux"
@@ -33,28 +36,34 @@ class AutomationConfig:
 class AutomationRunner:
     """Coordinates process launch, input replay, and screenshots."""
 
+    __slots__ = (
+        'config', '_capture_index', '_log_debug', '_pywinauto',
+        'window_manager', 'screenshot_handler', 'input_handler', 'process_manager',
+    )
+
     def __init__(self, config: AutomationConfig) -> None:
         """Initialize automation runner with configuration."""
         self.config = config
         self.config.screenshot_dir.mkdir(parents=True, exist_ok=True)
         self._capture_index = 0
+        # Resolve once; per-event debug calls are skipped entirely when disabled
+        self._log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         
         # Initialize platform-specific components
         if IS_LINUX:
-            # Lazy import to avoid circular imports
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent))
+            # Lazy import to avoid circular imports; the platform package
+            # resolves its names to the X11 backend classes on Linux
             try:
-                from platform.x11_automation import (
-                    X11WindowManager, X11Input, X11Screenshot, 
-                    X11ProcessManager, setup_linux_environment
+                from ..platform import (
+                    WindowManager, InputHandler, ScreenshotHandler,
+                    ProcessManager, setup_linux_environment
                 )
                 if not setup_linux_environment():
                     raise RuntimeError("Linux/X11 environment not properly configured")
-                self.window_manager = X11WindowManager()
-                self.screenshot_handler = X11Screenshot()
-                self.input_handler = X11Input()
-                self.process_manager = X11ProcessManager()
+                self.window_manager = WindowManager()
+                self.screenshot_handler = ScreenshotHandler()
+                self.input_handler = InputHandler()
+                self.process_manager = ProcessManager()
             except ImportError as e:
                 raise ImportError(
                     f"Missing Linux-specific dependencies: {e}"
@@ -206,7 +215,8 @@ class AutomationRunner:
         elif event.action == "key_press":
             self._send_key_windows(event)
         elif event.action == "key_release":
-            logging.debug("Key release event: %s", event.raw)
+            if self._log_debug:
+                logging.debug("Key release event: %s", event.raw)
         elif event.action == "exit":
             exit_path = self._event_screenshot_path(event)
             self._sleep_before_capture()
@@ -252,17 +262,18 @@ class AutomationRunner:
     def _capture_window_windows(self, window, path: Path) -> None:
         """Capture window on Windows using pywinauto."""
         import pyautogui
+        from ..platform.base import save_screenshot
         region = self._client_region_windows(window)
         if region:
             try:
                 image = pyautogui.screenshot(region=region)
-                image.save(path)
+                save_screenshot(image, path)
                 return
             except Exception as exc:
                 logging.warning("Client-area capture failed (%s); retrying with full window", exc)
         try:
             image = window.capture_as_image()
-            image.save(path)
+            save_screenshot(image, path)
         except Exception as exc:
             logging.warning("Window capture failed (%s), falling back to full screen", exc)
             self._capture_screen_windows(path)
@@ -284,9 +295,11 @@ class AutomationRunner:
     def _capture_screen_windows(self, path: Path) -> None:
         """Capture full screen on Windows."""
         import pyautogui
-        logging.debug("Capturing screen to %s", path)
+        from ..platform.base import save_screenshot
+        if self._log_debug:
+            logging.debug("Capturing screen to %s", path)
         image = pyautogui.screenshot()
-        image.save(path)
+        save_screenshot(image, path)
 
     # Linux-specific methods
     def _wait_for_window_linux(self, pid: int):
@@ -294,29 +307,29 @@ class AutomationRunner:
         deadline = time.time() + self.config.window_timeout
         while time.time() < deadline:
             try:
-                window_id = None
+                window = None
                 
                 if self.config.window_title:
-                    logging.debug(f"Searching for window with title containing: '{self.config.window_title}'")
-                    window_id = self.window_manager.find_window_by_title(self.config.window_title)
+                    logging.debug("Searching for window with title containing: '%s'", self.config.window_title)
+                    window = self.window_manager.find_window_by_title(self.config.window_title)
                 
-                if not window_id:
-                    logging.debug(f"Searching for windows by process ID: {pid}")
+                if not window:
+                    logging.debug("Searching for windows by process ID: %d", pid)
                     windows_by_process = self.window_manager.find_windows_by_process(pid)
                     if windows_by_process:
-                        window_id = windows_by_process[0]
-                        logging.debug(f"Found window 0x{window_id:x} by process {pid}")
+                        window = windows_by_process[0]
+                        logging.debug("Found window 0x%x by process %d", window.id, pid)
                 
-                if not window_id and not self.config.window_title:
+                if not window and not self.config.window_title:
                     logging.debug("Searching for any visible window")
-                    window_id = self.window_manager.find_any_visible_window()
-                    if window_id:
-                        logging.debug(f"Found fallback window 0x{window_id:x}")
+                    window = self.window_manager.find_any_visible_window()
+                    if window:
+                        logging.debug("Found fallback window 0x%x", window.id)
                 
-                if window_id:
-                    if self.window_manager.focus_window(window_id):
-                        logging.info(f"Successfully focused window 0x{window_id:x}")
-                        return window_id
+                if window:
+                    if self.window_manager.focus_window(window):
+                        logging.info("Successfully focused window 0x%x", window.id)
+                        return window
                         
                 time.sleep(0.2)
             except Exception as exc:
@@ -324,25 +337,26 @@ class AutomationRunner:
                 time.sleep(0.2)
         raise TimeoutError(f"Failed to locate window within {self.config.window_timeout} seconds")
 
-    def _handle_event_linux(self, window_id: int, event: Event) -> None:
+    def _handle_event_linux(self, window: "WindowHandle", event: Event) -> None:
         """Handle event on Linux using X11."""
         logging.info("Event %03d: %s", event.index, event.raw)
         if event.delta > 0:
             time.sleep(event.delta)
         if event.action == "mouse_press":
-            self._send_mouse_linux(window_id, event, press=True)
+            self._send_mouse_linux(window, event, press=True)
         elif event.action == "mouse_release":
-            self._send_mouse_linux(window_id, event, press=False)
+            self._send_mouse_linux(window, event, press=False)
         elif event.action == "key_press":
-            self._send_key_linux(window_id, event)
+            self._send_key_linux(window, event)
         elif event.action == "key_release":
-            logging.debug("Key release event: %s", event.raw)
+            if self._log_debug:
+                logging.debug("Key release event: %s", event.raw)
         elif event.action == "exit":
             exit_path = self._event_screenshot_path(event)
             self._sleep_before_capture()
-            self._capture_window_linux(window_id, exit_path)
+            self._capture_window_linux(window, exit_path)
             try:
-                self.window_manager.close_window(window_id)
+                self.window_manager.close_window(window)
             except Exception as exc:
                 logging.debug("Window close via X11 failed: %s", exc)
             return
@@ -350,9 +364,9 @@ class AutomationRunner:
             logging.warning("Unhandled event action: %s", event.action)
         screenshot_path = self._event_screenshot_path(event)
         self._sleep_before_capture()
-        self._capture_window_linux(window_id, screenshot_path)
+        self._capture_window_linux(window, screenshot_path)
 
-    def _send_mouse_linux(self, window_id: int, event: Event, press: bool) -> None:
+    def _send_mouse_linux(self, window: "WindowHandle", event: Event, press: bool) -> None:
         """Send mouse event on Linux using X11."""
         coords = None
         if event.window_point:
@@ -369,16 +383,19 @@ class AutomationRunner:
         else:
             self.input_handler.mouse_release(button)
 
-    def _send_key_linux(self, window_id: int, event: Event) -> None:
+    def _send_key_linux(self, window: "WindowHandle", event: Event) -> None:
         """Send keyboard event on Linux using X11."""
         if event.button:
             key = event.button
-            self.input_handler.send_key_to_window(window_id, key)
+            self.input_handler.send_key_to_window(window, key)
 
-    def _capture_window_linux(self, window_id: int, path: Path) -> None:
+    def _capture_window_linux(self, window: "WindowHandle", path: Path) -> None:
         """Capture window on Linux using X11."""
-        logging.debug("Capturing window %s to %s", window_id, path)
-        success = self.screenshot_handler.capture_window(window_id, path)
+        if self._log_debug:
+            logging.debug("Capturing window 0x%x to %s", window.id, path)
+        # Input is flushed without waiting; make sure it landed before capturing
+        self.input_handler.sync()
+        success = self.screenshot_handler.capture_window(window, path)
         if not success:
             logging.warning("Window capture failed, falling back to full screen")
             self.screenshot_handler.capture_screen(path)
@@ -420,11 +437,8 @@ class AutomationRunner:
             return
         try:
             if IS_LINUX and hasattr(self, 'process_manager'):
-                start_time = time.time()
-                while time.time() - start_time < self.config.exit_timeout:
-                    if not self.process_manager.is_process_running(process.pid):
-                        return
-                    time.sleep(0.1)
+                if not self.process_manager.wait_for_exit(process.pid, self.config.exit_timeout):
+                    logging.warning("Process did not exit within %.1f seconds", self.config.exit_timeout)
             else:
                 process.wait(timeout=self.config.exit_timeout)
         except subprocess.TimeoutExpired:
@@ -8,7 +8,6 @@ from .event_types import Event
 class ScriptParser:
     """Parses the textual transcript into structured events."""
 
-    DELTA_RE = re.compile(r"\[\s*\+(?P<delta>\d+(?:\.\d+)?)s\s*\]\s*(?P<body>.+)$")
     MOUSE_RE = re.compile(
         r"onMouse(?P<state>Pressed|Released)\s+(?P<button>[LR]):\s*(?P<details>.+)",
         re.IGNORECASE,
@@ -29,23 +28,23 @@ class ScriptParser:
     def parse(self, lines: Iterable[str]) -> List[Event]:
         """Parse transcript lines into event objects."""
         events: List[Event] = []
-        for idx, raw_line in enumerate(lines, start=1):
+        append = events.append
+        parse_line = self._parse_line
+        for raw_line in lines:
             line = raw_line.strip()
             if not line:
                 continue
-            events.append(self._parse_line(line, len(events)))
+            append(parse_line(line, len(events)))
         self._assign_deltas(events)
         return events
 
     def _parse_line(self, line: str, event_index: int) -> Event:
         """Parse a single line into an event object."""
-        delta_match = self.DELTA_RE.match(line)
-        if not delta_match:
-            raise ValueError(f"Could not parse timestamp in line: {line}")
-        timestamp = float(delta_match.group("delta"))
-        body = delta_match.group("body")
+        timestamp, body = self._split_timestamp(line)
+        # Only run the pattern whose fixed prefix matches the event kind
+        kind = body[:7].lower()
 
-        mouse_match = self.MOUSE_RE.match(body)
+        mouse_match = self.MOUSE_RE.match(body) if kind == "onmouse" else None
         if mouse_match:
             state = mouse_match.group("state").lower()
             button = mouse_match.group("button").upper()
@@ -67,7 +66,7 @@ class ScriptParser:
                 raw=line,
             )
 
-        key_match = self.KEY_RE.match(body)
+        key_match = self.KEY_RE.match(body) if kind.startswith("onkey") else None
         if key_match:
             state = key_match.group("state").lower()
             key = key_match.group("key")
@@ -97,6 +96,19 @@ class ScriptParser:
 
         raise ValueError(f"Unsupported event line: {line}")
 
+    def _split_timestamp(self, line: str) -> Tuple[float, str]:
+        """Split a ``[ +1.234s ] body`` line into its timestamp and body."""
+        head, sep, body = line.partition("]")
+        stamp = head[1:].strip() if head.startswith("[") else ""
+        body = body.lstrip()
+        if not sep or not body or not stamp.startswith("+") or not stamp.endswith("s"):
+            raise ValueError(f"Could not parse timestamp in line: {line}")
+        number = stamp[1:-1]
+        whole, dot, frac = number.partition(".")
+        if not whole.isdecimal() or (dot and not frac.isdecimal()):
+            raise ValueError(f"Could not parse timestamp in line: {line}")
+        return float(number), body
+
     def _parse_window(self, details: str) -> Optional[Tuple[int, int]]:
         """Parse window coordinates from event details."""
         match = self.WINDOW_RE.search(details)
@@ -4,6 +4,7 @@
 import argparse
 import logging
 import sys
+import time
 from pathlib import Path
 
 # Add src to path for imports
@@ -11,7 +12,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core import ScriptParser, AutomationRunner, AutomationConfig
 from src.analysis import generate_comparison
-from src.ui import InteractiveViewer
+
+
+class _RelativeTimeFormatter(logging.Formatter):
+    """Formatter that stamps records with seconds since startup.
+
+    Avoids the ``time.strftime`` call the default ``asctime`` performs for
+    every record, which adds up when debug-logging each replayed event.
+    """
+
+    _start = time.monotonic()
+
+    def formatTime(self, record, datefmt=None):
+        return "%.3f" % (time.monotonic() - self._start)
+
+
+def _configure_logging(level: str) -> None:
+    """Configure root logging with monotonic relative timestamps."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(_RelativeTimeFormatter("%(asctime)s %(levelname)s %(message)s"))
+    logging.basicConfig(level=getattr(logging, level), handlers=[handler])
 
 
 def _configure_pyautogui():
@@ -62,15 +82,13 @@ def main(argv=None):
     args = _parse_args(argv)
     
     # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s %(levelname)s %(message)s"
-    )
+    _configure_logging(args.log_level)
     
     # Handle interactive mode
     if args.mode == "interactive":
         if not args.inputs or len(args.inputs) < 2:
             raise SystemExit("Interactive mode requires --inputs with 2 (optionally 3) directories")
+        from src.ui import InteractiveViewer
         try:
             viewer = InteractiveViewer(list(args.inputs))
             viewer.run()
@@ -3,10 +3,44 @@ Platform-specific automation implementations.
 
 This module provides cross-platform support through abstract interfaces
 and platform-specific implementations for different operating systems.
+
+The backend for the running platform is resolved once at import time:
+``WindowManager``, ``InputHandler``, ``ScreenshotHandler`` and
+``ProcessManager`` name the concrete classes where one exists, while the
+abstract interfaces stay available under their ``*ABC`` aliases.
 """
 
-from .base import WindowManager, InputHandler, ScreenshotHandler, ProcessManager
+import sys
+
+from .base import (
+    WindowHandle,
+    WindowManager as WindowManagerABC,
+    InputHandler as InputHandlerABC,
+    ScreenshotHandler as ScreenshotHandlerABC,
+    ProcessManager as ProcessManagerABC,
+    save_screenshot,
+)
 
 __all__ = [
+    'WindowHandle', 'save_screenshot',
     'WindowManager', 'InputHandler', 'ScreenshotHandler', 'ProcessManager',
+    'WindowManagerABC', 'InputHandlerABC', 'ScreenshotHandlerABC', 'ProcessManagerABC',
 ]
+
+if sys.platform.startswith("linux"):
+    from .x11_automation import (
+        X11WindowManager as WindowManager,
+        X11Input as InputHandler,
+        X11Screenshot as ScreenshotHandler,
+        X11ProcessManager as ProcessManager,
+        check_x11_dependencies,
+        setup_linux_environment,
+    )
+    __all__ += ['check_x11_dependencies', 'setup_linux_environment']
+else:
+    # Windows automation is driven through pywinauto by AutomationRunner,
+    # so only the interfaces are exported here.
+    WindowManager = WindowManagerABC
+    InputHandler = InputHandlerABC
+    ScreenshotHandler = ScreenshotHandlerABC
+    ProcessManager = ProcessManagerABC
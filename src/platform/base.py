@@ -1,25 +1,57 @@
 """Base platform classes for cross-platform automation support."""
 
+import os
+import select
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
 from pathlib import Path
 
 
+@dataclass
+class WindowHandle:
+    """Opaque reference to a resolved platform window.
+    
+    Backends resolve the native window object once when the handle is
+    created and reuse it (and the cached geometry) on every later call.
+    """
+    
+    id: int
+    native: Any = None
+    geometry: Optional[Tuple[int, int, int, int]] = None
+
+
+def save_screenshot(image: Any, output_path: Path) -> None:
+    """Save a captured PIL image, favouring encode speed over file size.
+    
+    Screenshots are read back by the diff tools right away, so PNGs use
+    zlib level 1 without the optimizer; other formats the suffix selects
+    (``.bmp``, ``.ppm``) are written uncompressed as PIL does by default.
+    """
+    if Path(output_path).suffix.lower() == '.png':
+        image.save(output_path, optimize=False, compress_level=1)
+    else:
+        image.save(output_path)
+
+
 class WindowManager(ABC):
     """Abstract interface for window management across platforms."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def find_window_by_title(self, title_pattern: str) -> Optional[int]:
+    def find_window_by_title(self, title_pattern: str) -> Optional[WindowHandle]:
         """Find window by title pattern."""
         pass
     
     @abstractmethod
-    def focus_window(self, window_id: int) -> bool:
+    def focus_window(self, window: WindowHandle) -> bool:
         """Focus a specific window."""
         pass
     
     @abstractmethod
-    def close_window(self, window_id: int) -> bool:
+    def close_window(self, window: WindowHandle) -> bool:
         """Close a specific window."""
         pass
 
@@ -27,6 +59,8 @@ class WindowManager(ABC):
 class InputHandler(ABC):
     """Abstract interface for input simulation across platforms."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def move_mouse(self, x: int, y: int, duration: float = 0.0) -> bool:
         """Move mouse to coordinates."""
@@ -48,16 +82,27 @@ class InputHandler(ABC):
         pass
     
     @abstractmethod
-    def send_key_to_window(self, window_id: int, key_sym_str: str) -> bool:
+    def send_key_to_window(self, window: WindowHandle, key_sym_str: str) -> bool:
         """Send keyboard input to specific window."""
         pass
+    
+    def sync(self) -> None:
+        """Wait until previously sent input has been processed.
+        
+        Input methods may queue events without waiting for them; callers
+        that need to observe the result (e.g. before a screenshot) call this
+        once per batch instead of paying a round-trip per event.
+        """
+        pass
 
 
 class ScreenshotHandler(ABC):
     """Abstract interface for screenshot capture across platforms."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def capture_window(self, window_id: int, output_path: Path) -> bool:
+    def capture_window(self, window: WindowHandle, output_path: Path) -> bool:
         """Capture screenshot of specific window."""
         pass
     
@@ -65,11 +110,22 @@ class ScreenshotHandler(ABC):
     def capture_screen(self, output_path: Path) -> bool:
         """Capture full screen screenshot."""
         pass
+    
+    def capture_windows(self, windows: List[WindowHandle], output_dir: Path) -> List[bool]:
+        """Capture several windows into ``output_dir`` as ``window_0x<id>.png``.
+        
+        Captures run one after another; platforms that can capture
+        concurrently override this.
+        """
+        output_dir = Path(output_dir)
+        return [self.capture_window(window, output_dir / f"window_0x{window.id:x}.png") for window in windows]
 
 
 class ProcessManager(ABC):
     """Abstract interface for process management across platforms."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def is_process_running(self, pid: int) -> bool:
         """Check if process is running."""
@@ -84,3 +140,62 @@ class ProcessManager(ABC):
     def kill_process(self, pid: int) -> bool:
         """Force kill process."""
         pass
+    
+    def wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Wait for a process to exit.
+        
+        The kernel reports the exit through a pidfd on Linux (5.3+) or a
+        kqueue process filter on macOS/BSD; elsewhere ``is_process_running``
+        is polled.
+        
+        Args:
+            pid: Process ID to wait for
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if the process exited within the timeout
+        """
+        timeout = max(0.0, timeout)
+        try:
+            if hasattr(os, "pidfd_open"):
+                return _wait_pidfd(pid, timeout)
+            if hasattr(select, "kqueue"):
+                return _wait_kqueue(pid, timeout)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # e.g. ENOSYS on kernels without pidfd support
+        
+        deadline = time.monotonic() + timeout
+        while self.is_process_running(pid):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05, remaining))
+        return True
+
+
+def _wait_pidfd(pid: int, timeout: float) -> bool:
+    """Block on a pidfd until the process exits or the timeout elapses."""
+    fd = os.pidfd_open(pid)
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return bool(poller.poll(timeout * 1000))
+    finally:
+        os.close(fd)
+
+
+def _wait_kqueue(pid: int, timeout: float) -> bool:
+    """Block on a kqueue NOTE_EXIT event until the process exits or the timeout elapses."""
+    kq = select.kqueue()
+    try:
+        event = select.kevent(
+            pid,
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT,
+        )
+        return bool(kq.control([event], 1, timeout))
+    finally:
+        kq.close()
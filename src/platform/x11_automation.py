@@ -12,238 +12,445 @@ Required third-party packages (install with ``pip``):
 """
 
 import os
+import re
 import sys
+import shutil
+import string
+import subprocess
 import time
 import logging
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 # Check if we're on Linux
 IS_LINUX = platform.system().lower() == "linux"
 
-if IS_LINUX:
+# python-xlib and psutil are bound by _lazy_xlib() when the first X11
+# handler is created, so importing this module stays cheap
+X = Xatom = display = XK = xtest = request = psutil = None
+
+
+def _lazy_xlib() -> None:
+    """Import python-xlib and psutil into module globals on first use."""
+    global X, Xatom, display, XK, xtest, request, psutil
+    if X is not None:
+        return
     try:
-        from Xlib import X, display, XK
-        from Xlib.ext import xtest
-        import psutil
-        import subprocess
-        import re
+        from Xlib import X as _X, Xatom as _Xatom, display as _display, XK as _XK
+        from Xlib.ext import xtest as _xtest
+        from Xlib.protocol import request as _request
+        import psutil as _psutil
     except ImportError as exc:
-        raise SystemExit(
+        raise ImportError(
             "Missing Linux-specific dependencies. Install with 'pip install python-xlib psutil'. Original error: %s" % exc
         )
+    Xatom, display, XK, xtest, request, psutil = _Xatom, _display, _XK, _xtest, _request, _psutil
+    X = _X  # Bound last: it marks the imports as done
+
+from .base import WindowHandle, WindowManager, InputHandler, ScreenshotHandler, ProcessManager, save_screenshot
+
+
+def _window_geometry(window: WindowHandle, refresh: bool = False) -> Tuple[int, int, int, int]:
+    """Return the handle's geometry, querying the server only when not cached."""
+    if window.geometry is None or refresh:
+        geometry = window.native.get_geometry()
+        window.geometry = (geometry.x, geometry.y, geometry.width, geometry.height)
+    return window.geometry
+
+
+# Atoms used by the window manager, interned once on the shared connection
+_ATOM_NAMES = (
+    '_NET_WM_NAME', 'WM_NAME', 'WM_CLASS', 'WM_DELETE_WINDOW',
+    '_NET_WM_DESKTOP', '_NET_ACTIVE_WINDOW', '_NET_WM_PID', '_NET_CLIENT_LIST',
+)
+
+# Upper bound (in 32-bit units) fetched per text property
+_TEXT_PROPERTY_LENGTH = 1024
+
+# Initial fetch size (in 32-bit units, i.e. 64 bytes) for title/class
+# probes; longer values are completed in a follow-up request
+_PROPERTY_PROBE_LENGTH = 16
+
+# Titles of desktop/panel windows that are never replay targets
+_SYS_WINDOW_RE = re.compile(r'desktop|panel|taskbar|menu|system|root', re.I)
+
+
+def _intern_atoms(disp, names) -> dict:
+    """Intern several atoms with a single round-trip.
+    
+    All InternAtom requests are sent before the first reply is read,
+    instead of one blocking round-trip per ``intern_atom`` call.
+    """
+    cookies = [
+        (name, request.InternAtom(display=disp.display, defer=True, name=name, only_if_exists=False))
+        for name in names
+    ]
+    atoms = {}
+    for name, cookie in cookies:
+        cookie.reply()
+        atoms[name] = cookie.atom
+    return atoms
+
+
+# One X connection (and one set of interned atoms) shared by every handler,
+# opened on first use
+_DISPLAY = None
+_ATOMS: dict = {}
+_DISPLAY_LOCK = threading.Lock()
+
 
-from PIL import Image
+def _shared_display():
+    """Return the process-wide X display connection, opening it on first use."""
+    global _DISPLAY, _ATOMS
+    if _DISPLAY is None:
+        with _DISPLAY_LOCK:
+            if _DISPLAY is None:
+                disp = display.Display()
+                _ATOMS = _intern_atoms(disp, _ATOM_NAMES)
+                _DISPLAY = disp
+    return _DISPLAY
 
 
-class X11WindowManager:
+def _shared_atoms() -> dict:
+    """Return the atoms interned on the shared display."""
+    _shared_display()
+    return _ATOMS
+
+
+def _decode_text(prop: Optional[Tuple[int, bytes, int]]) -> Optional[str]:
+    """Decode an 8-bit text property; STRING is Latin-1, everything else UTF-8."""
+    if prop is None:
+        return None
+    prop_type, data, _bytes_after = prop
+    return data.decode('latin-1' if prop_type == Xatom.STRING else 'utf-8', 'replace')
+
+
+class WindowInfo(NamedTuple):
+    """Window discovered while walking the X11 window tree."""
+    
+    id: int
+    name: Optional[str]
+    wm_class: Optional[str]
+    depth: int
+
+
+class X11WindowManager(WindowManager):
     """X11-specific window management using python-xlib."""
     
+    __slots__ = ('display', 'screen', 'root', '_atoms')
+    
     def __init__(self):
         if not IS_LINUX:
             raise RuntimeError("X11WindowManager can only be used on Linux")
-        self.display = display.Display()
+        _lazy_xlib()
+        self.display = _shared_display()
         self.screen = self.display.screen()
         self.root = self.screen.root
+        self._atoms = _shared_atoms()
+        
+    def get_handle(self, window_id: int) -> WindowHandle:
+        """Resolve a window id into a reusable handle."""
+        return WindowHandle(window_id, self.display.create_resource_object('window', window_id))
+    
+    def find_window_by_title(self, title_pattern: str, max_depth: int = 3) -> Optional[WindowHandle]:
+        """Find window by title pattern using X11.
         
-    def find_window_by_title(self, title_pattern: str) -> Optional[object]:
-        """Find window by title pattern using X11."""
-        windows = self._get_window_tree()
+        Top-level application windows sit directly under the root or under
+        a window manager frame, so the search stops at ``max_depth`` and
+        returns as soon as a window matches.
+        """
+        pattern = title_pattern.lower()
         
-        for window_id, window_info in windows.items():
-            window_title = self._get_window_title(window_id)
-            window_class = self._get_window_class(window_id)
+        for window_id, window_title, window_class, _depth in self._iter_windows(max_depth):
             # Check both title and class for the pattern
-            if window_title and title_pattern.lower() in window_title.lower():
-                return window_id
-            if window_class and title_pattern.lower() in window_class.lower():
-                return window_id
+            if window_title and pattern in window_title.lower():
+                return self.get_handle(window_id)
+            if window_class and pattern in window_class.lower():
+                return self.get_handle(window_id)
         return None
     
-    def find_windows_by_process(self, pid: int) -> List[int]:
-        """Find all windows belonging to a specific process using xdotool."""
+    def find_windows_by_process(self, pid: int) -> List[WindowHandle]:
+        """Find all windows belonging to a specific process via ``_NET_WM_PID``."""
         try:
-            # Use xdotool to search for windows by process ID
-            result = subprocess.run(
-                ['xdotool', 'search', '--pid', str(pid)],
-                capture_output=True, text=True, check=False
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                window_ids = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        try:
-                            window_ids.append(int(line.strip()))
-                        except ValueError:
-                            continue
-                return window_ids
+            cookies = [
+                (window_id, self._request_property(window_id, self._atoms['_NET_WM_PID'], 1))
+                for window_id in self._client_window_ids()
+            ]
+            handles = []
+            for window_id, cookie in cookies:
+                try:
+                    cookie.reply()
+                except Exception as e:
+                    logging.debug(f"Error reading _NET_WM_PID of window {window_id}: {e}")
+                    continue
+                if cookie.property_type != Xatom.CARDINAL:
+                    continue
+                fmt, value = cookie.value
+                if fmt == 32 and len(value) and value[0] == pid:
+                    handles.append(self.get_handle(window_id))
+            return handles
         except Exception as e:
             logging.debug(f"Error finding windows by process {pid}: {e}")
         return []
     
-    def find_any_visible_window(self) -> Optional[int]:
-        """Find any visible window that might be our target."""
-        windows = self._get_window_tree()
+    def _client_window_ids(self, max_depth: int = 10) -> List[int]:
+        """Return the managed client windows, or every window if the WM does not list them."""
+        cookie = self._request_property(self.root.id, self._atoms['_NET_CLIENT_LIST'], _TEXT_PROPERTY_LENGTH)
+        try:
+            cookie.reply()
+            if cookie.property_type == Xatom.WINDOW:
+                fmt, value = cookie.value
+                if fmt == 32 and len(value):
+                    return list(value)
+        except Exception as e:
+            logging.debug(f"Error reading _NET_CLIENT_LIST: {e}")
         
-        # Try to find windows with meaningful properties
-        for window_id, window_info in windows.items():
-            window_title = self._get_window_title(window_id)
-            window_class = self._get_window_class(window_id)
-            
+        # Client windows usually sit below WM frames, so walk the whole tree
+        window_ids = []
+        level = self._query_children([self.root.id])
+        depth = 1
+        while level and depth <= max_depth:
+            window_ids.extend(level)
+            level = self._query_children(level)
+            depth += 1
+        return window_ids
+    
+    def find_any_visible_window(self, max_depth: int = 3) -> Optional[WindowHandle]:
+        """Find any visible window that might be our target."""
+        # Stops walking the tree as soon as a candidate turns up
+        for window_id, window_title, window_class, _depth in self._iter_windows(max_depth):
             # Skip windows without any identifying information
             if not window_title and not window_class:
                 continue
                 
             # Skip system windows (usually have no title or very generic titles)
-            if window_title and any(sys_win in window_title.lower() for sys_win in 
-                                   ['desktop', 'panel', 'taskbar', 'menu', 'system', 'root']):
+            if window_title and _SYS_WINDOW_RE.search(window_title):
                 continue
                 
             # Return the first reasonable window we find
             if window_title or window_class:
                 logging.debug(f"Found candidate window 0x{window_id:x}: title='{window_title}', class='{window_class}'")
-                return window_id
+                return self.get_handle(window_id)
         return None
     
-    def _get_window_tree(self) -> dict:
-        """Get all windows in the X11 window tree."""
-        windows = {}
+    def _iter_windows(self, max_depth: int = 10) -> Iterator[WindowInfo]:
+        """Yield windows breadth-first, one tree level at a time.
         
-        def traverse_tree(window, depth=0):
-            if depth > 10:  # Prevent infinite recursion
+        Every request for a level is sent before any of its replies is
+        read, so a level costs two round-trips (children, then text
+        properties) rather than three blocking round-trips per window.
+        Deeper levels are only queried once the consumer asks for them.
+        """
+        level = [self.root.id]
+        depth = 0
+        while level:
+            texts = self._fetch_window_texts(level)
+            for window_id, (title, wm_class) in zip(level, texts):
+                yield WindowInfo(window_id, title, wm_class, depth)
+            if depth >= max_depth:  # Prevent runaway traversal
                 return
-                
+            level = self._query_children(level)
+            depth += 1
+    
+    def _query_children(self, window_ids: List[int]) -> List[int]:
+        """Return the children of all given windows using pipelined QueryTree requests."""
+        cookies = [
+            request.QueryTree(display=self.display.display, defer=True, window=window_id)
+            for window_id in window_ids
+        ]
+        children = []
+        for window_id, cookie in zip(window_ids, cookies):
             try:
-                window_id = window.id
-                windows[window_id] = {
-                    'name': self._get_window_title(window_id),
-                    'class': self._get_window_class(window_id),
-                    'depth': depth
-                }
-                
-                # Traverse children
-                children = window.query_tree().children
-                for child in children:
-                    traverse_tree(child, depth + 1)
+                cookie.reply()
+                children.extend(child.id for child in cookie.children)
             except Exception as e:
-                logging.debug(f"Error traversing window tree: {e}")
+                logging.debug(f"Error traversing window tree at {window_id}: {e}")
+        return children
+    
+    def _fetch_window_texts(self, window_ids: List[int]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Return ``(title, class)`` for each window using pipelined GetProperty requests.
+        
+        The first batch probes 64 bytes of ``_NET_WM_NAME`` and ``WM_CLASS``.
+        A second batch fetches the rest of longer values and falls back to
+        ``WM_NAME`` only for classed windows lacking ``_NET_WM_NAME``;
+        windows with neither property (frames, helper windows) cost no
+        further requests.
+        """
+        atoms = self._atoms
+        net_name, wm_name, wm_class = atoms['_NET_WM_NAME'], atoms['WM_NAME'], atoms['WM_CLASS']
+        probes = [
+            (self._request_property(window_id, net_name, _PROPERTY_PROBE_LENGTH),
+             self._request_property(window_id, wm_class, _PROPERTY_PROBE_LENGTH))
+            for window_id in window_ids
+        ]
+        values = [
+            (self._read_property(window_id, name_cookie), self._read_property(window_id, class_cookie))
+            for window_id, (name_cookie, class_cookie) in zip(window_ids, probes)
+        ]
+        
+        followups = []
+        for window_id, (name, klass) in zip(window_ids, values):
+            if name is not None:
+                name_cookie = self._request_remainder(window_id, net_name, name)
+            elif klass is not None:
+                name_cookie = self._request_property(window_id, wm_name, _TEXT_PROPERTY_LENGTH)
+            else:
+                name_cookie = None
+            followups.append((name_cookie, self._request_remainder(window_id, wm_class, klass)))
         
-        traverse_tree(self.root)
-        return windows
+        texts = []
+        for window_id, (name, klass), (name_cookie, class_cookie) in zip(window_ids, values, followups):
+            texts.append((
+                _decode_text(self._complete_property(window_id, name, name_cookie)),
+                _decode_text(self._complete_property(window_id, klass, class_cookie)),
+            ))
+        return texts
     
-    def _get_window_title(self, window_id: int) -> Optional[str]:
-        """Get window title using X11."""
+    def _request_property(self, window_id: int, atom: int, length: int, offset: int = 0):
+        """Send a GetProperty request without waiting for its reply."""
+        return request.GetProperty(
+            display=self.display.display, defer=True, delete=False,
+            window=window_id, property=atom, type=X.AnyPropertyType,
+            long_offset=offset, long_length=length,
+        )
+    
+    def _request_remainder(self, window_id: int, atom: int, prop: Optional[Tuple[int, bytes, int]]):
+        """Request the part of a probed property that did not fit in the probe."""
+        if prop is None or not prop[2]:
+            return None
+        return self._request_property(window_id, atom, (prop[2] + 3) // 4, offset=len(prop[1]) // 4)
+    
+    def _read_property(self, window_id: int, cookie) -> Optional[Tuple[int, bytes, int]]:
+        """Wait for a GetProperty reply and return ``(type, data, bytes_after)`` for 8-bit values."""
         try:
-            window = self.display.create_resource_object('window', window_id)
-            title_prop = window.get_full_text_property(
-                self.display.intern_atom('_NET_WM_NAME')
-            )
-            if title_prop:
-                return title_prop.value
-                
-            # Fallback to older property
-            title_prop = window.get_full_text_property(
-                self.display.intern_atom('WM_NAME')
-            )
-            if title_prop:
-                return title_prop.value
+            cookie.reply()
         except Exception as e:
-            logging.debug(f"Error getting window title for {window_id}: {e}")
-        return None
+            logging.debug(f"Error reading property of window {window_id}: {e}")
+            return None
+        if not cookie.property_type:
+            return None
+        fmt, value = cookie.value
+        if fmt != 8 or not value:
+            return None
+        data = value.encode('latin-1') if isinstance(value, str) else bytes(value)
+        return cookie.property_type, data, cookie.bytes_after
+    
+    def _complete_property(self, window_id: int, prop, cookie) -> Optional[Tuple[int, bytes, int]]:
+        """Combine a probed property with its follow-up reply, if one was requested."""
+        if cookie is None:
+            return prop
+        rest = self._read_property(window_id, cookie)
+        if prop is None:
+            return rest
+        if rest is None:
+            return prop
+        return prop[0], prop[1] + rest[1], 0
+    
+    def _get_window_title(self, window_id: int) -> Optional[str]:
+        """Get window title using X11."""
+        return self._fetch_window_texts([window_id])[0][0]
     
     def _get_window_class(self, window_id: int) -> Optional[str]:
         """Get window class using X11."""
-        try:
-            window = self.display.create_resource_object('window', window_id)
-            class_prop = window.get_full_text_property(
-                self.display.intern_atom('WM_CLASS')
-            )
-            if class_prop:
-                return class_prop.value
-        except Exception as e:
-            logging.debug(f"Error getting window class for {window_id}: {e}")
-        return None
+        return self._fetch_window_texts([window_id])[0][1]
     
-    def get_window_geometry(self, window_id: int) -> Optional[Tuple[int, int, int, int]]:
-        """Get window geometry (x, y, width, height)."""
+    def get_window_geometry(self, window: WindowHandle, refresh: bool = False) -> Optional[Tuple[int, int, int, int]]:
+        """Get window geometry (x, y, width, height), cached on the handle."""
         try:
-            window = self.display.create_resource_object('window', window_id)
-            geometry = window.get_geometry()
-            return (geometry.x, geometry.y, geometry.width, geometry.height)
+            return _window_geometry(window, refresh)
         except Exception as e:
-            logging.debug(f"Error getting window geometry for {window_id}: {e}")
+            logging.debug(f"Error getting window geometry for {window.id}: {e}")
         return None
     
-    def focus_window(self, window_id: int) -> bool:
+    def focus_window(self, window: WindowHandle) -> bool:
         """Focus a window using X11."""
         try:
-            window = self.display.create_resource_object('window', window_id)
+            native = window.native
             
             # Raise the window
-            window.configure(stack_mode=X.Above)
+            native.configure(stack_mode=X.Above)
             
             # Set input focus
-            window.set_input_focus(X.RevertToParent, X.CurrentTime)
+            native.set_input_focus(X.RevertToParent, X.CurrentTime)
             
-            self.display.sync()
+            # Requests are processed in order, so later reads (e.g. the
+            # capture's GetImage) already observe the focus change
+            self.display.flush()
             return True
         except Exception as e:
-            logging.debug(f"Error focusing window {window_id}: {e}")
+            logging.debug(f"Error focusing window {window.id}: {e}")
             return False
     
-    def close_window(self, window_id: int) -> bool:
+    def close_window(self, window: WindowHandle) -> bool:
         """Close a window using X11."""
         try:
-            window = self.display.create_resource_object('window', window_id)
-            
             # Send WM_DELETE_WINDOW message
-            wm_delete = self.display.intern_atom('WM_DELETE_WINDOW')
-            window.event_send(X.Event(type=X.ClientMessage, 
-                                    window=window_id,
+            wm_delete = self._atoms['WM_DELETE_WINDOW']
+            window.native.event_send(X.Event(type=X.ClientMessage, 
+                                    window=window.id,
                                     client_type=wm_delete,
                                     data=(32, [wm_delete, X.CurrentTime, 0, 0, 0])))
             
-            self.display.sync()
+            self.display.flush()
             return True
         except Exception as e:
-            logging.debug(f"Error closing window {window_id}: {e}")
+            logging.debug(f"Error closing window {window.id}: {e}")
             return False
 
 
-class X11Screenshot:
+class X11Screenshot(ScreenshotHandler):
     """X11-specific screenshot functionality."""
     
+    __slots__ = ('_shm',)
+    
     def __init__(self):
         if not IS_LINUX:
             raise RuntimeError("X11Screenshot can only be used on Linux")
+        _lazy_xlib()
+        # One shared memory segment is attached up front and reused by every
+        # capture; without MIT-SHM the plain XGetImage path is used instead
+        try:
+            from .x11_shm import ShmCapture
+            self._shm = ShmCapture()
+        except Exception as e:
+            logging.debug(f"MIT-SHM capture unavailable: {e}")
+            self._shm = None
     
-    def capture_window(self, window_id: int, output_path: Path) -> bool:
+    def capture_window(self, window: WindowHandle, output_path: Path) -> bool:
         """Capture a specific window using X11."""
+        from PIL import Image
+        window_id = window.id
         try:
-            # Get window geometry
-            wm = X11WindowManager()
-            geometry = wm.get_window_geometry(window_id)
-            if not geometry:
-                logging.warning(f"Could not get geometry for window {window_id}")
+            # Re-queried per capture: the window may have been resized or
+            # maximised since the handle was last used
+            try:
+                x, y, width, height = _window_geometry(window, refresh=True)
+            except Exception as e:
+                logging.warning(f"Could not get geometry for window {window_id}: {e}")
                 return False
             
-            x, y, width, height = geometry
+            if self._shm is not None:
+                try:
+                    image = self._shm.capture(window_id, width, height)
+                    save_screenshot(image, output_path)
+                    logging.debug(f"Captured window using MIT-SHM: {output_path}")
+                    return True
+                except Exception as e:
+                    logging.debug(f"MIT-SHM capture failed for window {window_id}: {e}")
             
-            # Use scrot for screenshot if available, otherwise use import
+            # Read the window contents straight from the server; no helper
+            # process or intermediate file is involved
             try:
-                # Try using scrot (usually more reliable)
-                cmd = [
-                    'scrot', '-z',  # -z to silent mode
-                    '--focused',    # Capture focused window
-                    str(output_path)
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    logging.debug(f"Captured window using scrot: {output_path}")
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+                raw = window.native.get_image(0, 0, width, height, X.ZPixmap, 0xffffffff)
+                image = Image.frombytes('RGB', (width, height), raw.data, 'raw', 'BGRX')
+                save_screenshot(image, output_path)
+                logging.debug(f"Captured window using XGetImage: {output_path}")
+                return True
+            except Exception as e:
+                logging.debug(f"XGetImage capture failed for window {window_id}: {e}")
             
             # Fallback to ImageMagick's import command
             try:
@@ -259,35 +466,115 @@ class X11Screenshot:
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 pass
             
-            # Final fallback to xwd
+            # Final fallback: pipe xwd straight into convert, no temp file
             try:
-                cmd = [
-                    'xwd', '-id', str(window_id)
-                ]
-                with open(output_path.with_suffix('.xwd'), 'wb') as f:
-                    result = subprocess.run(cmd, stdout=f, timeout=10)
-                if result.returncode == 0:
-                    # Convert xwd to png using convert
-                    convert_cmd = ['convert', str(output_path.with_suffix('.xwd')), str(output_path)]
-                    subprocess.run(convert_cmd, capture_output=True, timeout=10)
-                    # Clean up xwd file
-                    output_path.with_suffix('.xwd').unlink(missing_ok=True)
+                xwd = subprocess.Popen(['xwd', '-id', str(window_id)], stdout=subprocess.PIPE)
+                try:
+                    convert = subprocess.run(
+                        ['convert', 'xwd:-', str(output_path)],
+                        stdin=xwd.stdout, capture_output=True, timeout=10
+                    )
+                finally:
+                    # Drop our end so xwd sees EPIPE if convert went away
+                    xwd.stdout.close()
+                    if xwd.poll() is None:
+                        try:
+                            xwd.wait(timeout=10)
+                        except subprocess.TimeoutExpired:
+                            xwd.kill()
+                            xwd.wait()
+                if xwd.returncode == 0 and convert.returncode == 0:
                     logging.debug(f"Captured window using xwd: {output_path}")
                     return True
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 pass
             
-            logging.warning("No screenshot tool available. Install scrot, ImageMagick, or xwd.")
+            logging.warning("No screenshot tool available. Install ImageMagick or xwd.")
             return False
             
         except Exception as e:
             logging.error(f"Error capturing window {window_id}: {e}")
             return False
     
+    def capture_windows(self, windows: List[WindowHandle], output_dir: Path, max_workers: int = 4) -> List[bool]:
+        """Capture several windows concurrently into ``output_dir``.
+        
+        Each worker thread opens its own X connection, so the XGetImage
+        round-trips and PNG encoding of different windows overlap. Windows
+        that fail there are retried one by one through ``capture_window``
+        and its fallbacks.
+        """
+        output_dir = Path(output_dir)
+        paths = [output_dir / f"window_0x{window.id:x}.png" for window in windows]
+        if not windows:
+            return []
+        
+        from PIL import Image
+        
+        local = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+        
+        def connect():
+            local.display = display.Display()
+            with connections_lock:
+                connections.append(local.display)
+        
+        def capture(window: WindowHandle, output_path: Path) -> bool:
+            try:
+                native = local.display.create_resource_object('window', window.id)
+                # Queried on this worker's connection; the handle's cached
+                # geometry may predate a resize
+                geometry = native.get_geometry()
+                width, height = geometry.width, geometry.height
+                raw = native.get_image(0, 0, width, height, X.ZPixmap, 0xffffffff)
+                image = Image.frombytes('RGB', (width, height), raw.data, 'raw', 'BGRX')
+                save_screenshot(image, output_path)
+                return True
+            except Exception as e:
+                logging.debug(f"Concurrent capture failed for window {window.id}: {e}")
+                return False
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(windows)), initializer=connect) as pool:
+                results = list(pool.map(capture, windows, paths))
+        except Exception as e:
+            logging.debug(f"Concurrent window capture unavailable: {e}")
+            results = [False] * len(windows)
+        finally:
+            for connection in connections:
+                connection.close()
+        
+        return [
+            ok or self.capture_window(window, output_path)
+            for ok, window, output_path in zip(results, windows, paths)
+        ]
+    
     def capture_screen(self, output_path: Path) -> bool:
         """Capture the entire screen using X11."""
+        from PIL import Image
         try:
-            # Try scrot first
+            # Read the root window in-process, like capture_window
+            try:
+                root = _shared_display().screen().root
+                geometry = root.get_geometry()
+                width, height = geometry.width, geometry.height
+                image = None
+                if self._shm is not None:
+                    try:
+                        image = self._shm.capture(root.id, width, height)
+                    except Exception as e:
+                        logging.debug(f"MIT-SHM screen capture failed: {e}")
+                if image is None:
+                    raw = root.get_image(0, 0, width, height, X.ZPixmap, 0xffffffff)
+                    image = Image.frombytes('RGB', (width, height), raw.data, 'raw', 'BGRX')
+                save_screenshot(image, output_path)
+                logging.debug(f"Captured screen using XGetImage: {output_path}")
+                return True
+            except Exception as e:
+                logging.debug(f"XGetImage screen capture failed: {e}")
+            
+            # Fall back to scrot
             try:
                 cmd = ['scrot', str(output_path)]
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
@@ -315,13 +602,60 @@ class X11Screenshot:
             return False
 
 
-class X11Input:
+class X11Input(InputHandler):
     """X11-specific input simulation."""
     
-    def __init__(self):
+    __slots__ = ('display', 'key_press_delay', 'focus_delay', '_has_xtest', '_keycode_cache')
+    
+    def __init__(self, key_press_delay: float = 0.005, focus_delay: float = 0.01):
+        """Create the input handler.
+        
+        ``key_press_delay`` is the pause between a key's press and release
+        and ``focus_delay`` the pause after focusing a window before typing
+        into it; either may be 0 for applications that do not need them.
+        """
         if not IS_LINUX:
             raise RuntimeError("X11Input can only be used on Linux")
-        self.display = display.Display()
+        _lazy_xlib()
+        self.key_press_delay = key_press_delay
+        self.focus_delay = focus_delay
+        self.display = _shared_display()
+        # XTEST injects events directly on our connection. Without it, pointer
+        # events fall back to core requests; xdotool is not spawned per event
+        # since it relies on XTEST for the same operations
+        self._has_xtest = self.display.query_extension('XTEST') is not None
+        # Key name -> keycode; letters and digits are resolved up front
+        self._keycode_cache = {}
+        for key in string.ascii_letters + string.digits:
+            self._keycode(key)
+    
+    def _keycode(self, key_sym_str: str) -> int:
+        """Resolve a keysym name to a keycode (0 if unknown), memoized per name."""
+        keycode = self._keycode_cache.get(key_sym_str)
+        if keycode is None:
+            keysym = XK.string_to_keysym(key_sym_str)
+            keycode = self.display.keysym_to_keycode(keysym) if keysym else 0
+            if keycode:
+                self._keycode_cache[key_sym_str] = keycode
+        return keycode
+    
+    def _check_keymap(self) -> None:
+        """Drop memoized keycodes if the keyboard mapping changed.
+        
+        The server sends MappingNotify to every client when the layout or
+        modifier mapping changes; the shared connection selects no other
+        events, so draining its queue here is safe.
+        """
+        while self.display.pending_events():
+            event = self.display.next_event()
+            if event.type == X.MappingNotify:
+                self.display.refresh_keyboard_mapping(event)
+                self._keycode_cache.clear()
+                logging.debug("Keyboard mapping changed; keycode cache cleared")
+    
+    def sync(self) -> None:
+        """Block until the X server has processed all queued input."""
+        self.display.sync()
     
     def move_mouse(self, x: int, y: int, duration: float = 0.0) -> bool:
         """Move mouse to coordinates using X11."""
@@ -331,18 +665,14 @@ class X11Input:
                 # For now, just move directly
                 pass
             
-            # Use xdotool if available for better reliability
-            try:
-                cmd = ['xdotool', 'mousemove', str(x), str(y)]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            if self._has_xtest:
+                xtest.fake_input(self.display, X.MotionNotify, x=x, y=y)
+                self.display.flush()
+                return True
             
-            # Fallback to X11 direct input
+            # Without XTEST, warp the pointer with a core request
             self.display.warp_pointer(None, self.display.screen().root, 0, 0, 0, 0, x, y)
-            self.display.sync()
+            self.display.flush()
             return True
             
         except Exception as e:
@@ -356,16 +686,12 @@ class X11Input:
             if not button_code:
                 return False
             
-            # Try xdotool first
-            try:
-                cmd = ['xdotool', 'mousedown', str(button_code)]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            if self._has_xtest:
+                xtest.fake_input(self.display, X.ButtonPress, button_code)
+                self.display.flush()
+                return True
             
-            # Fallback to X11 direct input
+            # Without XTEST, deliver a synthetic event to the root window
             event = X.ButtonPressEvent()
             event.window = self.display.screen().root
             event.root = self.display.screen().root
@@ -380,7 +706,7 @@ class X11Input:
             event.same_screen = 1
             
             self.display.send_event(event, self.display.screen().root, X.ButtonPressMask)
-            self.display.sync()
+            self.display.flush()
             return True
             
         except Exception as e:
@@ -394,16 +720,12 @@ class X11Input:
             if not button_code:
                 return False
             
-            # Try xdotool first
-            try:
-                cmd = ['xdotool', 'mouseup', str(button_code)]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            if self._has_xtest:
+                xtest.fake_input(self.display, X.ButtonRelease, button_code)
+                self.display.flush()
+                return True
             
-            # Fallback to X11 direct input
+            # Without XTEST, deliver a synthetic event to the root window
             event = X.ButtonReleaseEvent()
             event.window = self.display.screen().root
             event.root = self.display.screen().root
@@ -418,7 +740,7 @@ class X11Input:
             event.same_screen = 1
             
             self.display.send_event(event, self.display.screen().root, X.ButtonReleaseMask)
-            self.display.sync()
+            self.display.flush()
             return True
             
         except Exception as e:
@@ -441,67 +763,105 @@ class X11Input:
     def send_key(self, key_sym_str: str) -> bool:
         """Send a key press and release using X11."""
         try:
-            # Try xdotool first for better reliability
-            try:
-                cmd = ['xdotool', 'key', key_sym_str]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-            
-            # Fallback to X11 direct input
-            # Convert keysym to keycode
-            keysym = XK.string_to_keysym(key_sym_str)
-            if keysym == 0:
-                logging.error(f"Unknown keysym: {key_sym_str}")
+            if not self._has_xtest:
+                logging.error(f"XTEST extension not available; cannot send key '{key_sym_str}'")
                 return False
-            keycode = self.display.keysym_to_keycode(keysym)
+            
+            self._check_keymap()
+            keycode = self._keycode(key_sym_str)
             if keycode == 0:
                 logging.error(f"Could not resolve keycode for keysym {key_sym_str}")
                 return False
             
             # Send press and release
             xtest.fake_input(self.display, X.KeyPress, keycode)
-            self.display.sync()
-            time.sleep(0.05)
+            self.display.flush()
+            if self.key_press_delay > 0:
+                time.sleep(self.key_press_delay)
             xtest.fake_input(self.display, X.KeyRelease, keycode)
-            self.display.sync()
+            self.display.flush()
             return True
             
         except Exception as e:
             logging.error(f"Error sending key '{key_sym_str}': {e}")
             return False
 
-    def send_key_to_window(self, window_id: int, key_sym_str: str) -> bool:
+    def send_key_to_window(self, window: WindowHandle, key_sym_str: str) -> bool:
         """Send a key press and release to a specific window."""
         try:
             # Try to set input focus to the window
             try:
-                window = self.display.create_resource_object('window', window_id)
-                window.set_input_focus(X.RevertToParent, X.CurrentTime)
-                self.display.sync()
-                time.sleep(0.05)
+                self.display.set_input_focus(window.id, X.RevertToParent, X.CurrentTime)
+                self.display.flush()
+                if self.focus_delay > 0:
+                    time.sleep(self.focus_delay)
             except Exception as e:
-                logging.debug(f"Failed to set focus to window {window_id}: {e}")
+                logging.debug(f"Failed to set focus to window {window.id}: {e}")
             
             # Send the key using the send_key method
             return self.send_key(key_sym_str)
             
         except Exception as e:
-            logging.error(f"Error sending key to window {window_id}: {e}")
+            logging.error(f"Error sending key to window {window.id}: {e}")
             return False
 
 
-class ProcessManager:
-    """Cross-platform process management."""
+class X11ProcessManager(ProcessManager):
+    """Process management for Linux using psutil."""
     
-    @staticmethod
-    def find_process_by_name(process_name: str) -> Optional[int]:
+    __slots__ = ()
+    
+    # Linux truncates /proc/<pid>/comm to 15 characters
+    _COMM_LENGTH = 15
+    _PROCESS_TTL = 1.0
+    _process_cache: Tuple[Tuple[str, int, bool], ...] = ()
+    _process_cache_time = float('-inf')
+    
+    @classmethod
+    def _process_names(cls) -> Tuple[Tuple[str, int, bool], ...]:
+        """Return (casefolded comm, pid, truncated) triples in pid order, cached briefly."""
+        now = time.monotonic()
+        if now - cls._process_cache_time >= cls._PROCESS_TTL:
+            entries = []
+            for pid in sorted(int(entry) for entry in os.listdir('/proc') if entry.isdecimal()):
+                try:
+                    with open(f'/proc/{pid}/comm', 'rb') as f:
+                        comm = f.read().rstrip(b'\n')
+                except OSError:
+                    continue  # Exited between listdir and open
+                entries.append((comm.decode('utf-8', 'replace').casefold(), pid, len(comm) >= cls._COMM_LENGTH))
+            cls._process_cache = tuple(entries)
+            cls._process_cache_time = now
+        return cls._process_cache
+    
+    @classmethod
+    def find_process_by_name(cls, process_name: str) -> Optional[int]:
         """Find process ID by name."""
+        needle = process_name.casefold()
+        # comm is truncated, so longer names can only be matched by psutil,
+        # which recovers the full name from the command line
+        if len(needle) <= cls._COMM_LENGTH:
+            try:
+                entries = cls._process_names()
+            except OSError as e:
+                logging.debug(f"Cannot scan /proc for {process_name}: {e}")
+            else:
+                for name, pid, truncated in entries:
+                    if needle in name:
+                        return pid
+                    # The needle may sit past the cut; only psutil sees it
+                    if truncated:
+                        _lazy_xlib()
+                        try:
+                            if needle in psutil.Process(pid).name().casefold():
+                                return pid
+                        except Exception:
+                            continue  # Exited or inaccessible
+                return None
+        _lazy_xlib()
         try:
             for proc in psutil.process_iter(['pid', 'name']):
-                if process_name.lower() in proc.info['name'].lower():
+                if needle in proc.info['name'].casefold():
                     return proc.info['pid']
         except Exception as e:
             logging.debug(f"Error finding process {process_name}: {e}")
@@ -510,14 +870,17 @@ class ProcessManager:
     @staticmethod
     def is_process_running(pid: int) -> bool:
         """Check if process is running."""
+        _lazy_xlib()
         try:
-            return psutil.pid_exists(pid)
+            # Exited children linger as zombies until reaped; treat them as gone
+            return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
         except Exception:
             return False
     
     @staticmethod
     def terminate_process(pid: int) -> bool:
         """Terminate a process gracefully."""
+        _lazy_xlib()
         try:
             proc = psutil.Process(pid)
             proc.terminate()
@@ -529,6 +892,7 @@ class ProcessManager:
     @staticmethod
     def kill_process(pid: int) -> bool:
         """Force kill a process."""
+        _lazy_xlib()
         try:
             proc = psutil.Process(pid)
             proc.kill()
@@ -543,20 +907,9 @@ def check_x11_dependencies() -> List[str]:
     missing = []
     
     # Check for screenshot tools
-    screenshot_tools = ['scrot', 'import', 'xwd']
-    found_screenshot = False
-    for tool in screenshot_tools:
-        if subprocess.run(['which', tool], capture_output=True).returncode == 0:
-            found_screenshot = True
-            break
-    
-    if not found_screenshot:
+    if not any(shutil.which(tool) for tool in ('scrot', 'import', 'xwd')):
         missing.append("screenshot tool (install scrot, imagemagick, or xwd)")
     
-    # Check for input tools
-    if subprocess.run(['which', 'xdotool'], capture_output=True).returncode != 0:
-        missing.append("xdotool")
-    
     # Check for X11 display
     if not os.environ.get('DISPLAY'):
         missing.append("DISPLAY environment variable (X11 server not running)")
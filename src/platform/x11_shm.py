@@ -0,0 +1,238 @@
+"""MIT-SHM window capture for X11.
+
+python-xlib has no binding for the MIT-SHM extension, so this module talks
+to libX11/libXext through ctypes. A single System V shared memory segment,
+sized for the whole screen, is attached to the X server once and reused
+for every capture: the server writes pixels straight into it instead of
+streaming them over the X socket.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from PIL import Image
+
+_ZPIXMAP = 2
+_ALL_PLANES = ctypes.c_ulong(-1).value
+_IPC_PRIVATE = 0
+_IPC_CREAT = 0o1000
+_IPC_RMID = 0
+
+# XImage headers kept for recently captured sizes; older ones are freed
+_MAX_IMAGES = 4
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ('shmseg', ctypes.c_ulong),
+        ('shmid', ctypes.c_int),
+        ('shmaddr', ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+
+class _XImage(ctypes.Structure):
+    # Leading fields of Xlib's XImage; only these are read
+    _fields_ = [
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('xoffset', ctypes.c_int),
+        ('format', ctypes.c_int),
+        ('data', ctypes.c_void_p),
+        ('byte_order', ctypes.c_int),
+        ('bitmap_unit', ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('bytes_per_line', ctypes.c_int),
+        ('bits_per_pixel', ctypes.c_int),
+        ('red_mask', ctypes.c_ulong),
+        ('green_mask', ctypes.c_ulong),
+        ('blue_mask', ctypes.c_ulong),
+        ('obdata', ctypes.c_void_p),
+    ]
+
+
+class _XErrorEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('resourceid', ctypes.c_ulong),
+        ('serial', ctypes.c_ulong),
+        ('error_code', ctypes.c_ubyte),
+        ('request_code', ctypes.c_ubyte),
+        ('minor_code', ctypes.c_ubyte),
+    ]
+
+
+_ERROR_HANDLER = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_XErrorEvent))
+
+# Error codes seen while _trap_errors is active
+_trapped_errors = []
+
+
+def _record_error(dpy, event) -> int:
+    _trapped_errors.append(event.contents.error_code)
+    return 0
+
+
+# Module-level so libX11 never holds a pointer to a freed trampoline
+_ERROR_TRAP = _ERROR_HANDLER(_record_error)
+
+
+@contextmanager
+def _trap_errors(xlib: ctypes.CDLL):
+    """Record X errors instead of exiting, restoring the previous handler after.
+    
+    Xlib's default handler exits the process, and the handler is global,
+    so it is only replaced for the duration of the enclosed calls. Yields
+    the list the error codes are appended to.
+    """
+    _trapped_errors.clear()
+    previous = xlib.XSetErrorHandler(ctypes.cast(_ERROR_TRAP, ctypes.c_void_p))
+    try:
+        yield _trapped_errors
+    finally:
+        xlib.XSetErrorHandler(previous)
+
+
+def _load(name: str) -> ctypes.CDLL:
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise OSError(f"lib{name} not found")
+    return ctypes.CDLL(path)
+
+
+class ShmCapture:
+    """Reusable MIT-SHM capture context bound to its own Xlib connection."""
+
+    def __init__(self):
+        self._xlib = xlib = _load('X11')
+        self._xext = xext = _load('Xext')
+        self._libc = libc = ctypes.CDLL(None, use_errno=True)
+
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XOpenDisplay.restype = ctypes.c_void_p
+        xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDefaultVisual.restype = ctypes.c_void_p
+        xlib.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XFree.argtypes = [ctypes.c_void_p]
+        xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+        xlib.XSetErrorHandler.restype = ctypes.c_void_p
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmCreateImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+            ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint,
+        ]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmGetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage),
+            ctypes.c_int, ctypes.c_int, ctypes.c_ulong,
+        ]
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+        self._dpy = None
+        self._info = None
+        # XImage headers by (width, height), least recently used first
+        self._images = OrderedDict()
+
+        self._dpy = xlib.XOpenDisplay(None)
+        if not self._dpy:
+            raise OSError("Cannot open X display")
+        if not xext.XShmQueryExtension(self._dpy):
+            self.close()
+            raise OSError("MIT-SHM extension not available")
+
+        screen = xlib.XDefaultScreen(self._dpy)
+        self._visual = xlib.XDefaultVisual(self._dpy, screen)
+        self._depth = xlib.XDefaultDepth(self._dpy, screen)
+        self._capacity = xlib.XDisplayWidth(self._dpy, screen) * xlib.XDisplayHeight(self._dpy, screen) * 4
+
+        shmid = libc.shmget(_IPC_PRIVATE, self._capacity, _IPC_CREAT | 0o600)
+        if shmid < 0:
+            self.close()
+            raise OSError(ctypes.get_errno(), "shmget failed")
+        addr = libc.shmat(shmid, None, 0)
+        if addr in (None, ctypes.c_void_p(-1).value):
+            libc.shmctl(shmid, _IPC_RMID, None)
+            self.close()
+            raise OSError(ctypes.get_errno(), "shmat failed")
+        self._info = _XShmSegmentInfo(0, shmid, addr, 0)
+        with _trap_errors(xlib) as errors:
+            attached = xext.XShmAttach(self._dpy, ctypes.byref(self._info))
+            xlib.XSync(self._dpy, 0)
+        # Marked for removal now; the kernel frees it once both sides detach
+        libc.shmctl(shmid, _IPC_RMID, None)
+        if not attached or errors:
+            # The server never attached; only detach locally
+            libc.shmdt(addr)
+            self._info = None
+            self.close()
+            raise OSError("XShmAttach failed")
+
+    def capture(self, window_id: int, width: int, height: int) -> Image.Image:
+        """Copy a window's contents into the shared segment and decode it."""
+        if width * height * 4 > self._capacity:
+            raise ValueError(f"{width}x{height} exceeds the shared segment")
+        image = self._images.get((width, height))
+        if image is not None:
+            self._images.move_to_end((width, height))
+        else:
+            image = self._xext.XShmCreateImage(
+                self._dpy, self._visual, self._depth, _ZPIXMAP,
+                self._info.shmaddr, ctypes.byref(self._info), width, height,
+            )
+            if not image:
+                raise OSError("XShmCreateImage failed")
+            self._images[(width, height)] = image
+            if len(self._images) > _MAX_IMAGES:
+                # All headers share the one segment; free only the struct
+                _, evicted = self._images.popitem(last=False)
+                self._xlib.XFree(evicted)
+
+        with _trap_errors(self._xlib) as errors:
+            ok = self._xext.XShmGetImage(self._dpy, window_id, image, 0, 0, _ALL_PLANES)
+        if not ok or errors:
+            raise OSError(f"XShmGetImage failed for window 0x{window_id:x} (errors {errors})")
+
+        ximage = image.contents
+        if ximage.bits_per_pixel != 32:
+            raise OSError(f"Unsupported pixel layout: {ximage.bits_per_pixel} bpp")
+        stride = ximage.bytes_per_line
+        buffer = (ctypes.c_char * (stride * height)).from_address(self._info.shmaddr)
+        return Image.frombuffer('RGB', (width, height), buffer, 'raw', 'BGRX', stride, 1)
+
+    def close(self) -> None:
+        """Release the shared segment, cached images and the display connection."""
+        for image in self._images.values():
+            # The pixel data lives in the shared segment; free only the struct
+            self._xlib.XFree(image)
+        self._images.clear()
+        if self._info is not None:
+            self._xext.XShmDetach(self._dpy, ctypes.byref(self._info))
+            self._xlib.XSync(self._dpy, 0)
+            self._libc.shmdt(self._info.shmaddr)
+            self._info = None
+        if self._dpy:
+            self._xlib.XCloseDisplay(self._dpy)
+            self._dpy = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception as e:
+            logging.debug(f"Error releasing MIT-SHM capture: {e}")
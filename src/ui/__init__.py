@@ -5,6 +5,12 @@ This module provides interactive tools for viewing and analyzing
 image differences through graphical interfaces.
 """
 
-from .interactive_viewer import InteractiveViewer
-
 __all__ = ['InteractiveViewer']
+
+
+def __getattr__(name):
+    # Tk and the imaging stack are only loaded once the viewer is requested
+    if name == 'InteractiveViewer':
+        from .interactive_viewer import InteractiveViewer
+        return InteractiveViewer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
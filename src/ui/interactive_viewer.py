@@ -4,18 +4,66 @@ This module provides a GUI for viewing and comparing image sets with
 different display modes (side-by-side, overlay, split, diff).
 """
 
+import functools
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 try:
     import tkinter as tk
-    from PIL import Image, ImageTk, ImageChops
+    import numpy as np
+    from PIL import Image, ImageTk
 except ImportError as exc:
     raise ImportError(
-        "Interactive viewer requires tkinter and Pillow. Install with 'pip install pillow'. Original error: %s" % exc
+        "Interactive viewer requires tkinter, NumPy and Pillow. Install with 'pip install numpy pillow'. Original error: %s" % exc
     )
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Overlay frames above this many pixels are blended on all cores when
+# Numba is installed; NumPy's ufuncs run on a single thread
+_PARALLEL_BLEND_PIXELS = 2_000_000
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _blend_uint8(a, b, ai):
+        """Fixed-point blend of two HxWx3 uint8 arrays, rows split across threads."""
+        out = np.empty_like(a)
+        for y in prange(a.shape[0]):
+            for x in range(a.shape[1]):
+                for c in range(a.shape[2]):
+                    out[y, x, c] = (np.uint32(a[y, x, c]) * (256 - ai) + np.uint32(b[y, x, c]) * ai) >> 8
+        return out
+    
+    def _warm_blend() -> None:
+        """Compile the blend for the read-only arrays it is called with."""
+        sample = np.zeros((1, 1, 3), dtype=np.uint8)
+        sample.flags.writeable = False
+        _blend_uint8(sample, sample, 0)
+
+
+def _scan_png(directory: Path) -> Dict[str, str]:
+    """Map PNG file names in ``directory`` to their paths in one scandir pass.
+    
+    Selects what ``glob("*.png")`` did, dotfiles and symlinked files
+    included, without building a ``Path`` per entry. Unlike the glob,
+    directories whose name ends in ``.png`` are skipped.
+    """
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry.path
+            for entry in entries
+            if entry.name.endswith(".png") and entry.is_file()
+        }
+
 
 class InteractiveViewer:
     """Interactive image viewer for comparing image sets."""
@@ -49,8 +97,8 @@ class InteractiveViewer:
     
     def _load_files(self) -> None:
         """Load and match image files across directories."""
-        self.files_a = {p.name: p for p in self.dir_a.glob("*.png")}
-        self.files_b = {p.name: p for p in self.dir_b.glob("*.png")}
+        self.files_a = _scan_png(self.dir_a)
+        self.files_b = _scan_png(self.dir_b)
         self.names = sorted(self.files_a.keys() & self.files_b.keys())
         
         if not self.names:
@@ -58,7 +106,18 @@ class InteractiveViewer:
         
         self.files_diff = {}
         if self.dir_diff:
-            self.files_diff = {p.name: p for p in self.dir_diff.glob("*.png")}
+            self.files_diff = _scan_png(self.dir_diff)
+        
+        # Decoded images (A, B and diff of the most recently shown names)
+        # are cached per role; a new file mapping starts with an empty cache.
+        # The prefetch worker fills the same cache, so lookups are locked;
+        # decodes in progress are tracked so a key is only decoded once
+        self._role_files = {"a": self.files_a, "b": self.files_b, "d": self.files_diff}
+        self._decode_lock = threading.Lock()
+        self._decoded = OrderedDict()
+        self._decoding = {}
+        self._target_size = functools.lru_cache(maxsize=64)(self._read_target_size)
+        self._draftable = functools.lru_cache(maxsize=None)(self._read_draftable)
     
     def _setup_viewer(self) -> None:
         """Set up the tkinter viewer interface."""
@@ -83,17 +142,53 @@ class InteractiveViewer:
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Split-mode divider, moved with coords() and hidden in other modes
+        self._splitter_id = self.canvas.create_line(0, 0, 0, 0, fill="#FFD54F", width=2, state=tk.HIDDEN)
+        
+        # Help text is laid out once; renders only toggle its visibility
+        help_text = (
+            "←/→ prev/next   1 side  2 overlay  3 split  4 diff   "
+            "[/] alpha   ,/. split   F fit   H help"
+        )
+        self._help_id = self.canvas.create_text(
+            10, 10, anchor=tk.NW, text=help_text, fill="#fff", font=("Segoe UI", 10), state=tk.HIDDEN
+        )
+        
         # Bind events
+        self._pending_render = None
         self._bind_events()
         
+        # Inputs resized for the current canvas, keyed by (name, role) and size
+        self._fit_cache = OrderedDict()
+        self._preview = False
+        self._preview_used = False
+        self._preview_timer = None
+        
+        # Fallback |a - b| for the pair currently on screen
+        self._diff = None
+        
+        # Scratch arrays reused by _compose, one per purpose
+        self._compose_buf = {}
+        
+        # Single worker decoding neighbours while the current pair is shown
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetching = []
+        
         # Initial render
         self.photo = None
+        self._img_id = None
+        self._last_sig = None
+        self._canvas_size = None
         self.render()
+        
+        # JIT-compile the parallel blend before the first large overlay
+        if HAS_NUMBA:
+            self.root.after_idle(_warm_blend)
     
     def _bind_events(self) -> None:
         """Bind keyboard and mouse events."""
         # Window events
-        self.canvas.bind("<Configure>", lambda e: self.render())
+        self.canvas.bind("<Configure>", self._on_configure)
         self.canvas.bind("<Button-1>", self._on_click)
         self.canvas.bind("<B1-Motion>", self._on_drag)
         
@@ -150,7 +245,8 @@ class InteractiveViewer:
         """
         self.alpha = max(0.0, min(1.0, a))
         if self.mode == 1:  # Only re-render in overlay mode
-            self.render()
+            self._start_preview()
+            self._schedule_render()
     
     def _set_split(self, s: float) -> None:
         """Set split position.
@@ -160,7 +256,23 @@ class InteractiveViewer:
         """
         self.split = max(0.0, min(1.0, s))
         if self.mode == 2:  # Only re-render in split mode
-            self.render()
+            self._start_preview()
+            self._schedule_render()
+    
+    def _schedule_render(self) -> None:
+        """Render within ~16ms, folding any further requests into that render.
+        
+        Held keys and split-bar drags fire far faster than a frame can be
+        composed; only the latest state needs to be drawn.
+        """
+        if self._pending_render is not None:
+            self.root.after_cancel(self._pending_render)
+        self._pending_render = self.root.after(16, self._do_render)
+    
+    def _do_render(self) -> None:
+        """Run a render requested through ``_schedule_render``."""
+        self._pending_render = None
+        self.render()
     
     def prev(self) -> None:
         """Show previous image pair."""
@@ -176,101 +288,376 @@ class InteractiveViewer:
         """Load current image pair for display.
         
         Returns:
-            Tuple of (name, image_a, image_b, diff_image)
+            Tuple of (name, (image_a, image_b, diff_image), (array_a, array_b, diff_array))
         """
         name = self.names[self.index]
-        a = Image.open(self.files_a[name]).convert("RGB")
-        b = Image.open(self.files_b[name]).convert("RGB")
+        images, arrays = self._load_for_mode(name, self.mode, self._draft_size())
+        return name, images, arrays
+    
+    def _load_for_mode(self, name: str, mode: int, draft_size: Optional[tuple]) -> tuple:
+        """Decode only the images ``mode`` displays for ``name``.
         
-        # Resize if needed
-        if a.size != b.size:
-            b = b.resize(a.size, Image.LANCZOS)
+        Diff mode with a diff file never touches A or B; the other modes
+        never open the diff file. Images that are not needed are None.
+        Safe to call from the prefetch worker: it does not touch Tk.
         
-        # Load diff image if available
-        d = None
-        if name in self.files_diff:
-            try:
-                d = Image.open(self.files_diff[name]).convert("RGB")
-                if d.size != a.size:
-                    d = d.resize(a.size, Image.LANCZOS)
-            except Exception:
-                d = None
+        Returns:
+            Tuple of ((image_a, image_b, diff_image), (array_a, array_b, diff_array))
+        """
+        if mode == 3 and name in self.files_diff:
+            d, arr_d = self._load_image(name, "d", draft_size)
+            if d is not None:
+                return (None, None, d), (None, None, arr_d)
+        a, arr_a = self._load_image(name, "a", draft_size)
+        b, arr_b = self._load_image(name, "b", draft_size)
+        return (a, b, None), (arr_a, arr_b, None)
+    
+    def _load_image(self, name: str, role: str, draft_size: Optional[tuple]) -> tuple:
+        """Return the cached ``_decode_image`` result, decoding it if needed.
+        
+        The draft size only becomes part of the cache key when a file the
+        result depends on can actually be drafted; for PNG it is dropped,
+        so resizing or toggling fit does not re-decode anything.
+        
+        The lock only guards the cache; decoding runs outside it, so the Tk
+        thread never waits for a neighbour the prefetch worker is decoding.
+        A thread asking for a key that is already being decoded waits for
+        that decode instead of starting its own.
+        """
+        if draft_size is not None and not self._uses_draft(name, role):
+            draft_size = None
+        key = (name, role, draft_size)
+        with self._decode_lock:
+            cached = self._decoded.get(key)
+            if cached is not None:
+                self._decoded.move_to_end(key)
+                return cached
+            pending = self._decoding.get(key)
+            if pending is None:
+                pending = self._decoding[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result()
+        
+        try:
+            result = self._decode_image(name, role, draft_size)
+        except BaseException as e:
+            with self._decode_lock:
+                del self._decoding[key]
+            pending.set_exception(e)
+            raise
+        with self._decode_lock:
+            del self._decoding[key]
+            self._decoded[key] = result
+            if len(self._decoded) > 24:
+                self._decoded.popitem(last=False)
+        pending.set_result(result)
+        return result
+    
+    def _uses_draft(self, name: str, role: str) -> bool:
+        """Return whether drafting changes the image decoded for ``name`` and ``role``.
+        
+        B and diff depend on A as well, since they are aligned to its size.
+        """
+        if self._draftable(self.files_a[name]):
+            return True
+        return role != "a" and self._draftable(self._role_files[role][name])
+    
+    def _draft_size(self) -> Optional[tuple]:
+        """Return the smallest decode size that still fills the canvas, or None.
+        
+        Rounded up to 256px steps so resizing the window does not
+        invalidate the decode cache on every pixel.
+        """
+        if not self.fit:
+            return None
+        cw = self.canvas.winfo_width()
+        ch = self.canvas.winfo_height()
+        if cw <= 1 or ch <= 1:
+            return None
+        return (-(-cw // 256) * 256, -(-ch // 256) * 256)
+    
+    def _decode_image(self, name: str, role: str, draft_size: Optional[tuple] = None) -> tuple:
+        """Decode one image of the set stored under ``name``, matched to A's size.
+        
+        Args:
+            name: File name present in the input directories
+            role: ``"a"``, ``"b"`` or ``"d"`` (diff directory)
+            draft_size: Size the decoder may reduce to (formats with DCT
+                scaling, i.e. JPEG); the result is never smaller than it
+        
+        Returns:
+            Tuple of (image, array); the array holds the same pixels as
+            HxWx3 uint8, converted once so every later composition works on
+            it directly. A diff image that fails to load gives (None, None).
+        """
+        files = self._role_files[role]
+        try:
+            img = self._open(files[name], draft_size)
+            # convert() copies even when the mode already matches
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            if role != "a":
+                # Aligned once here; every render reuses the cached copy
+                size = self._target_size(name, draft_size if self._draftable(self.files_a[name]) else None)
+                if img.size != size:
+                    img = self._resample(img, size, Image.LANCZOS)
+        except Exception:
+            if role != "d":
+                raise
+            return None, None
+        return img, np.asarray(img)
+    
+    def _read_target_size(self, name: str, draft_size: Optional[tuple] = None) -> tuple:
+        """Return the size B and diff are aligned to: A's, read from its header."""
+        with self._open(self.files_a[name], draft_size) as img:
+            return img.size
+    
+    @staticmethod
+    def _read_draftable(path: str) -> bool:
+        """Return whether ``Image.draft`` can reduce decoding of ``path`` (JPEG only)."""
+        try:
+            with Image.open(path) as img:
+                return img.format == "JPEG"
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _open(path: str, draft_size: Optional[tuple]) -> Image.Image:
+        """Open ``path`` lazily, letting the decoder downscale to ``draft_size``."""
+        img = Image.open(path)
+        if draft_size is not None:
+            img.draft("RGB", draft_size)
+        return img
+    
+    def _prefetch(self) -> None:
+        """Queue decoding of the neighbouring pairs on the background worker.
         
-        return name, a, b, d
+        Prefetches queued for an earlier position that have not started
+        yet are dropped.
+        """
+        for future in self._prefetching:
+            future.cancel()
+        draft_size = self._draft_size()
+        self._prefetching = [
+            self._pool.submit(self._prefetch_name, self.names[(self.index + offset) % len(self.names)], self.mode, draft_size)
+            for offset in (1, -1)
+        ]
+    
+    def _prefetch_name(self, name: str, mode: int, draft_size: Optional[tuple]) -> None:
+        """Decode ``name`` for ``mode`` into the cache (runs on the worker thread)."""
+        try:
+            self._load_for_mode(name, mode, draft_size)
+        except Exception as e:
+            logging.debug(f"Prefetch of {name} failed: {e}")
     
-    def _compose(self, a: Image.Image, b: Image.Image, d: Optional[Image.Image]) -> Image.Image:
+    def _compose(self, name: str, images: tuple, arrays: tuple) -> Image.Image:
         """Compose images based on current display mode.
         
+        The result is already scaled to the canvas when fitting: inputs are
+        downscaled first (and cached per canvas size), so no mode builds a
+        full-size composite. Composition itself is done on 3-channel uint8
+        arrays (uint16 only for the blend terms, never float), keeping the
+        bytes moved per pixel low; only the final frame becomes a PIL image.
+        
         Args:
-            a: First image
-            b: Second image
-            d: Optional difference image
+            name: File name of the pair, used as the resize cache key
+            images: ``(a, b, d)`` PIL images; those the mode does not show may be None
+            arrays: The same images as uint8 arrays
             
         Returns:
             Composed image for display
         """
+        a, b, d = images
+        arr_a, arr_b, arr_d = arrays
+        
         if self.mode == 0:  # side-by-side
             w, h = a.size
-            out = Image.new("RGB", (w*2, h), (0, 0, 0))
-            out.paste(a, (0, 0))
-            out.paste(b, (w, 0))
-            return out
+            scale = self._fit_scale(w * 2, h)
+            if scale < 1.0:
+                # Downscale each half straight to its share of the canvas
+                nw, nh = max(2, int(w * 2 * scale)), max(1, int(h * scale))
+                half = nw // 2
+                arr_a = self._fitted((name, "a"), a, arr_a, (half, nh))
+                arr_b = self._fitted((name, "b"), b, arr_b, (nw - half, nh))
+            out = self._buffer("frame", (arr_a.shape[0], arr_a.shape[1] + arr_b.shape[1], 3))
+            out[:, :arr_a.shape[1]] = arr_a
+            out[:, arr_a.shape[1]:] = arr_b
             
         elif self.mode == 1:  # overlay
-            return Image.blend(a, b, self.alpha)
+            size = self._fit_size(a.size)
+            # Blending is linear, so blending the downscaled inputs gives
+            # the same frame as downscaling the full-size blend
+            arr_a = self._fitted((name, "a"), a, arr_a, size)
+            arr_b = self._fitted((name, "b"), b, arr_b, size)
+            # Fixed-point blend: alpha in 1/256 steps, uint16 intermediates
+            ai = int(self.alpha * 256)
+            if HAS_NUMBA and arr_a.shape[0] * arr_a.shape[1] > _PARALLEL_BLEND_PIXELS:
+                out = _blend_uint8(arr_a, arr_b, ai)
+            else:
+                acc = np.multiply(arr_a, 256 - ai, out=self._buffer("acc", arr_a.shape, np.uint16), dtype=np.uint16)
+                acc += np.multiply(arr_b, ai, out=self._buffer("term", arr_b.shape, np.uint16), dtype=np.uint16)
+                acc >>= 8
+                out = self._buffer("frame", arr_a.shape)
+                np.copyto(out, acc, casting="unsafe")
             
         elif self.mode == 2:  # split
-            w, h = a.size
-            x = int(self.split * w)
-            out = Image.new("RGB", (w, h), (0, 0, 0))
-            out.paste(a.crop((0, 0, x, h)), (0, 0))
-            out.paste(b.crop((x, 0, w, h)), (x, 0))
-            return out
+            size = self._fit_size(a.size)
+            arr_a = self._fitted((name, "a"), a, arr_a, size)
+            arr_b = self._fitted((name, "b"), b, arr_b, size)
+            # Split in display space; dragging never resamples
+            x = int(self.split * size[0])
+            out = self._buffer("frame", arr_a.shape)
+            out[:, :x] = arr_a[:, :x]
+            out[:, x:] = arr_b[:, x:]
             
         else:  # diff mode
             if d is not None:
-                return d
-            return ImageChops.difference(a, b)
+                out = self._fitted((name, "d"), d, arr_d, self._fit_size(d.size))
+            else:
+                # The difference is not linear: take it at full size, then fit
+                diff, arr_diff = self._pair_diff(arr_a, arr_b)
+                out = self._fitted((name, "diff"), diff, arr_diff, self._fit_size(diff.size))
+        
+        return Image.fromarray(out)
     
-    def _fit_image(self, img: Image.Image) -> Image.Image:
-        """Scale image to fit window if needed.
+    def _buffer(self, role: str, shape: tuple, dtype=np.uint8) -> np.ndarray:
+        """Return the reusable compose buffer for ``role``, reallocated only on shape change.
         
-        Args:
-            img: Input image
-            
-        Returns:
-            Scaled image
+        Every caller overwrites the whole buffer, so it is never cleared.
+        The frame built in it is copied by ``Image.fromarray``.
+        """
+        buf = self._compose_buf.get(role)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self._compose_buf[role] = np.empty(shape, dtype)
+        return buf
+    
+    def _pair_diff(self, arr_a: np.ndarray, arr_b: np.ndarray) -> tuple:
+        """Return ``|a - b|`` per channel as ``(image, array)``, computed once per pair."""
+        if self._diff is None or self._diff[0] is not arr_a or self._diff[1] is not arr_b:
+            # max - min never wraps, so the difference stays in uint8
+            arr_diff = np.maximum(arr_a, arr_b)
+            arr_diff -= np.minimum(arr_a, arr_b)
+            self._diff = (arr_a, arr_b, Image.fromarray(arr_diff), arr_diff)
+        return self._diff[2], self._diff[3]
+    
+    def _fit_scale(self, iw: int, ih: int) -> float:
+        """Return the factor that fits an ``iw`` x ``ih`` image into the canvas.
+        
+        Returns 1.0 when fitting is off or the canvas is not laid out yet.
         """
+        if not self.fit:
+            return 1.0
+        
         cw = self.canvas.winfo_width()
         ch = self.canvas.winfo_height()
         
         if cw <= 1 or ch <= 1:
-            return img
-        
-        if not self.fit:
-            return img
-        
-        iw, ih = img.size
-        scale = min(cw / iw, ch / ih)
+            return 1.0
         
+        return min(cw / iw, ch / ih)
+    
+    def _fit_size(self, size: tuple) -> tuple:
+        """Return the display size of an image of ``size`` under the current fit."""
+        iw, ih = size
+        scale = self._fit_scale(iw, ih)
         if scale < 1.0:
-            nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-            return img.resize((nw, nh), Image.LANCZOS)
+            return max(1, int(iw * scale)), max(1, int(ih * scale))
+        return size
+    
+    def _fitted(self, key: tuple, img: Image.Image, arr: np.ndarray, size: tuple) -> np.ndarray:
+        """Return ``img`` resampled to ``size`` as a uint8 array, cached under ``key`` and size.
+        
+        ``arr`` (the same pixels as an array) is returned as-is when no
+        resampling is needed. The cache only lives as long as the canvas
+        size (see ``_on_configure``) and keeps the 16 most recent entries.
+        While a live preview is running, large reductions use BILINEAR
+        instead of LANCZOS; the LANCZOS frame replaces it once input settles.
+        """
+        if img.size == size:
+            return arr
+        for resample in ((Image.LANCZOS, Image.BILINEAR) if self._preview else (Image.LANCZOS,)):
+            cached = self._fit_cache.get((key, size, resample))
+            if cached is not None:
+                self._fit_cache.move_to_end((key, size, resample))
+                return cached
+        
+        resample = Image.LANCZOS
+        if self._preview and size[0] * 2 <= img.size[0]:
+            resample = Image.BILINEAR
+            self._preview_used = True
+        cached = np.asarray(self._resample(img, size, resample))
+        self._fit_cache[(key, size, resample)] = cached
+        if len(self._fit_cache) > 16:
+            self._fit_cache.popitem(last=False)
+        return cached
+    
+    @staticmethod
+    def _resample(img: Image.Image, size: tuple, resample: int) -> Image.Image:
+        """Resize ``img`` to ``size``, taking large reductions in two steps.
         
-        return img
+        When the image is at least twice the target on both axes, an integer
+        box reduction (``Image.reduce`` by 8, 4 or 2) does the bulk of the
+        work and ``resample`` only covers the remaining factor below 2.
+        """
+        ratio = min(img.size[0] // size[0], img.size[1] // size[1])
+        for factor in (8, 4, 2):
+            if ratio >= factor:
+                img = img.reduce(factor)
+                break
+        return img.resize(size, resample)
+    
+    def _on_configure(self, event) -> None:
+        """Drop resized images when the canvas size changes, then redraw."""
+        size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if size == self._canvas_size:
+            return
+        self._canvas_size = size
+        self._fit_cache.clear()
+        self._start_preview()
+        self.render()
+    
+    def _start_preview(self) -> None:
+        """Prefer fast resampling until input has been idle for 200ms."""
+        self._preview = True
+        if self._preview_timer is not None:
+            self.root.after_cancel(self._preview_timer)
+        self._preview_timer = self.root.after(200, self._end_preview)
+    
+    def _end_preview(self) -> None:
+        """Leave preview mode, redrawing if a preview-quality frame is shown."""
+        self._preview_timer = None
+        self._preview = False
+        if self._preview_used:
+            self._preview_used = False
+            self._last_sig = None
+            self.render()
     
     def render(self) -> None:
-        """Render the current image pair."""
-        name, a, b, d = self._load_pair()
-        composed = self._compose(a, b, d)
-        disp = self._fit_image(composed)
+        """Render the current image pair.
         
-        self.photo = ImageTk.PhotoImage(disp)
-        self.canvas.delete("all")
-        
-        # Calculate center position
+        Returns early when every input that affects the frame is the same
+        as for the last render.
+        """
         cw = self.canvas.winfo_width()
         ch = self.canvas.winfo_height()
+        # Split is kept to canvas-pixel precision so dragging stays smooth
+        sig = (self.index, self.mode, round(self.alpha, 2), round(self.split * cw), self.fit, cw, ch, self.help_on)
+        if sig == self._last_sig:
+            return
+        
+        name, images, arrays = self._load_pair()
+        disp = self._compose(name, images, arrays)
+        
+        # Same-sized frames are written into the existing Tk image in place
+        if self.photo is not None and self.photo.width() == disp.size[0] and self.photo.height() == disp.size[1]:
+            self.photo.paste(disp)
+        else:
+            self.photo = ImageTk.PhotoImage(disp)
+        
+        # Calculate center position
         x = max(0, (cw - disp.size[0]) // 2)
         y = max(0, (ch - disp.size[1]) // 2)
         
@@ -278,24 +665,35 @@ class InteractiveViewer:
         self._draw_x, self._draw_y = x, y
         self._draw_w, self._draw_h = disp.size
         
-        # Draw image
-        self.canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
+        # Draw image, reusing the canvas item across renders
+        if self._img_id is None:
+            self._img_id = self.canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
+            self.canvas.tag_lower(self._img_id)
+        else:
+            self.canvas.coords(self._img_id, x, y)
+            self.canvas.itemconfigure(self._img_id, image=self.photo)
         
-        # Draw splitter in split mode
+        # Position splitter in split mode
         if self.mode == 2:
             sx = x + int(self.split * self._draw_w)
-            self.canvas.create_line(sx, y, sx, y + self._draw_h, fill="#FFD54F", width=2)
+            self.canvas.coords(self._splitter_id, sx, y, sx, y + self._draw_h)
+            self.canvas.itemconfigure(self._splitter_id, state=tk.NORMAL)
+        else:
+            self.canvas.itemconfigure(self._splitter_id, state=tk.HIDDEN)
         
         # Update window title
         self.root.title(f"{self.names[self.index]}  |  {self.modes[self.mode]}  |  {self.dir_a.name} vs {self.dir_b.name}")
         
-        # Draw help text
-        if self.help_on:
-            help_text = (
-                "←/→ prev/next   1 side  2 overlay  3 split  4 diff   "
-                "[/] alpha   ,/. split   F fit   H help"
-            )
-            self.canvas.create_text(10, 10, anchor=tk.NW, text=help_text, fill="#fff", font=("Segoe UI", 10))
+        # Show or hide help text
+        self.canvas.itemconfigure(self._help_id, state=tk.NORMAL if self.help_on else tk.HIDDEN)
+        
+        # Recorded only once the frame is on a mapped canvas, so a failed
+        # or premature render is redone by the next call
+        if cw > 1 and ch > 1:
+            self._last_sig = sig
+        
+        # Warm the cache for prev/next navigation
+        self._prefetch()
     
     def _on_click(self, event) -> None:
         """Handle mouse click events."""
@@ -321,4 +719,9 @@ class InteractiveViewer:
     
     def run(self) -> None:
         """Start the interactive viewer."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            for future in self._prefetching:
+                future.cancel()
+            self._pool.shutdown(wait=False)
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures for the grafika_differ test suite.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the ``src`` package importable for every test module, once
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Modules under test, imported once per session and shared through fixtures
+_MODULES = {
+    name: importlib.import_module(f"src.{name}")
+    for name in ("core.event_types", "core.event_parser")
+}
+
+
+@pytest.fixture(scope="session")
+def event_mod():
+    """The ``src.core.event_types`` module."""
+    return _MODULES["core.event_types"]
+
+
+@pytest.fixture(scope="session")
+def parser_mod():
+    """The ``src.core.event_parser`` module."""
+    return _MODULES["core.event_parser"]
+
+
+@pytest.fixture
+def image_dirs(tmp_path):
+    """Fresh ``(a, b, output)`` directories under the test's ``tmp_path``."""
+    dirs = (tmp_path / "a", tmp_path / "b", tmp_path / "output")
+    for d in dirs:
+        d.mkdir()
+    return dirs
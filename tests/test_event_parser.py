@@ -2,18 +2,10 @@
 Tests for event parsing functionality.
 """
 
-import sys
-from pathlib import Path
 
-# Add parent directory to path to import the module
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.core.event_parser import ScriptParser
-
-
-def test_parse_mouse_events():
+def test_parse_mouse_events(parser_mod):
     """Test parsing of mouse events."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     lines = [
         "[ +0.123s ] onMousePressed L: window(100,100) -> world(-16.666666,16.666666)",
@@ -43,9 +35,9 @@ def test_parse_mouse_events():
     assert event2.world_point == (-10.0, 5.0)
 
 
-def test_parse_keyboard_events():
+def test_parse_keyboard_events(parser_mod):
     """Test parsing of keyboard events."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     lines = [
         "[ +0.123s ] onKeyPressed D: test key press",
@@ -73,9 +65,9 @@ def test_parse_keyboard_events():
     assert event3.button == "1"
 
 
-def test_parse_exit_event():
+def test_parse_exit_event(parser_mod):
     """Test parsing of application exit event."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     lines = [
         "[ +10.500s ] Exiting application"
@@ -91,9 +83,9 @@ def test_parse_exit_event():
     assert event.world_point is None
 
 
-def test_delta_assignment():
+def test_delta_assignment(parser_mod):
     """Test that deltas are correctly assigned between events."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     lines = [
         "[ +1.000s ] onMousePressed L: first event",
@@ -115,9 +107,9 @@ def test_delta_assignment():
     assert abs(events[2].delta - 0.7) < 0.001  # Use approximate comparison for floating point
 
 
-def test_empty_lines_skipped():
+def test_empty_lines_skipped(parser_mod):
     """Test that empty lines are skipped during parsing."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     lines = [
         "[ +0.123s ] onMousePressed L: first event",
@@ -133,9 +125,9 @@ def test_empty_lines_skipped():
     assert events[1].action == "key_press"
 
 
-def test_invalid_line_raises_error():
+def test_invalid_line_raises_error(parser_mod):
     """Test that invalid event lines raise ValueError."""
-    parser = ScriptParser()
+    parser = parser_mod.ScriptParser()
     
     invalid_lines = [
         "This is not a valid event line",
@@ -151,25 +143,27 @@ def test_invalid_line_raises_error():
             pass  # Expected
 
 
-if __name__ == "__main__":
-    print("Testing event parser...")
-    
-    test_parse_mouse_events()
-    print("✓ Mouse event parsing test passed")
-    
-    test_parse_keyboard_events()
-    print("✓ Keyboard event parsing test passed")
-    
-    test_parse_exit_event()
-    print("✓ Exit event parsing test passed")
-    
-    test_delta_assignment()
-    print("✓ Delta assignment test passed")
-    
-    test_empty_lines_skipped()
-    print("✓ Empty lines skipping test passed")
+def test_timestamp_formats(parser_mod):
+    """Test accepted and rejected timestamp prefixes."""
+    parser = parser_mod.ScriptParser()
     
-    test_invalid_line_raises_error()
-    print("✓ Invalid line error handling test passed")
+    events = parser.parse([
+        "[+2s]onKeyPressed D: compact timestamp",
+        "[   +3.25s   ]   onKeyPressed W: padded timestamp",
+    ])
+    assert [event.timestamp for event in events] == [2.0, 3.25]
+    assert [event.button for event in events] == ["D", "W"]
     
-    print("\nAll event parser tests passed!")
+    invalid_lines = [
+        "[ +1.s ] onKeyPressed D: missing fraction",
+        "[ 1.0s ] onKeyPressed D: missing plus sign",
+        "[ +1.0 ] onKeyPressed D: missing unit",
+        "[ +1.0s ]",
+        "+1.0s ] onKeyPressed D: missing bracket",
+    ]
+    for line in invalid_lines:
+        try:
+            parser.parse([line])
+            assert False, f"Should have raised ValueError for line: {line}"
+        except ValueError:
+            pass  # Expected
@@ -2,17 +2,12 @@
 Tests for event types and event handling.
 """
 
-import sys
-from pathlib import Path
+import dataclasses
 
-# Add parent directory to path to import the module
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.event_types import Event
-
-
-def test_event_creation():
+def test_event_creation(event_mod):
     """Test Event dataclass creation and basic attributes."""
+    Event = event_mod.Event
     event = Event(
         index=1,
         timestamp=1.5,
@@ -34,26 +29,24 @@ def test_event_creation():
     assert event.raw == "[ +1.500s ] onMousePressed L: test event"
 
 
-def test_event_label():
+def test_event_label(event_mod):
     """Test Event label generation."""
-    # Test mouse event with button
-    mouse_event = Event(0, 0, 0, "mouse_press", "left", None, None, "")
-    assert mouse_event.label() == "mouse_press_left"
+    base = event_mod.Event(0, 0, 0, "", None, None, None, "")
     
-    mouse_release = Event(0, 0, 0, "mouse_release", "right", None, None, "")
-    assert mouse_release.label() == "mouse_release_right"
+    # Test mouse event with button
+    assert dataclasses.replace(base, action="mouse_press", button="left").label() == "mouse_press_left"
+    assert dataclasses.replace(base, action="mouse_release", button="right").label() == "mouse_release_right"
     
     # Test keyboard event
-    key_event = Event(0, 0, 0, "key_press", "A", None, None, "")
-    assert key_event.label() == "key_press_A"
+    assert dataclasses.replace(base, action="key_press", button="A").label() == "key_press_A"
     
     # Test event without button
-    exit_event = Event(0, 0, 0, "exit", None, None, None, "")
-    assert exit_event.label() == "exit"
+    assert dataclasses.replace(base, action="exit").label() == "exit"
 
 
-def test_event_with_none_values():
+def test_event_with_none_values(event_mod):
     """Test Event creation with None values for optional fields."""
+    Event = event_mod.Event
     event = Event(
         index=0,
         timestamp=0.0,
@@ -69,18 +62,3 @@ def test_event_with_none_values():
     assert event.window_point is None
     assert event.world_point is None
     assert event.label() == "exit"
-
-
-if __name__ == "__main__":
-    print("Testing event types...")
-    
-    test_event_creation()
-    print("✓ Event creation test passed")
-    
-    test_event_label()
-    print("✓ Event label test passed")
-    
-    test_event_with_none_values()
-    print("✓ Event with None values test passed")
-    
-    print("\nAll event type tests passed!")
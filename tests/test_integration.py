@@ -4,14 +4,23 @@ Integration tests for the refactored grafika_differ package.
 This test verifies that the refactored modules can be imported and used together.
 """
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 
-# Add parent directory to path to import the module
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+# Script lines for the parser integration check and the (action, button)
+# each one should produce
+_LINES = (
+    "[ +0.123s ] onMousePressed L: window(100,100) -> world(-16.666666,16.666666)",
+    "[ +0.456s ] onKeyPressed D: test key",
+)
+_EXPECTED = (("mouse_press", "left"), ("key_press", "D"))
 
-def test_core_module_imports():
+
+def _check_core_module_imports():
     """Test that core modules can be imported successfully."""
     try:
         from src.core import Event, ScriptParser, AutomationRunner
@@ -22,7 +31,7 @@ def test_core_module_imports():
     return True
 
 
-def test_platform_module_imports():
+def _check_platform_module_imports():
     """Test that platform modules can be imported successfully."""
     try:
         from src.platform import (
@@ -36,7 +45,7 @@ def test_platform_module_imports():
     return True
 
 
-def test_analysis_module_imports():
+def _check_analysis_module_imports():
     """Test that analysis modules can be imported successfully."""
     try:
         from src.analysis import OpenRouterClient, ImageAnalyzer, generate_comparison
@@ -47,7 +56,7 @@ def test_analysis_module_imports():
     return True
 
 
-def test_ui_module_imports():
+def _check_ui_module_imports():
     """Test that UI modules can be imported successfully."""
     try:
         from src.ui import InteractiveViewer
@@ -58,7 +67,7 @@ def test_ui_module_imports():
     return True
 
 
-def test_event_parser_integration():
+def _check_event_parser_integration():
     """Test that event parser works with event types."""
     try:
         from src.core.event_parser import ScriptParser
@@ -66,19 +75,13 @@ def test_event_parser_integration():
         
         # Parse some test events
         parser = ScriptParser()
-        lines = [
-            "[ +0.123s ] onMousePressed L: window(100,100) -> world(-16.666666,16.666666)",
-            "[ +0.456s ] onKeyPressed D: test key",
-        ]
-        
-        events = parser.parse(lines)
+        events = parser.parse(list(_LINES))
         
-        assert len(events) == 2
-        assert isinstance(events[0], Event)
-        assert events[0].action == "mouse_press"
-        assert events[0].button == "left"
-        assert events[1].action == "key_press"
-        assert events[1].button == "D"
+        assert len(events) == len(_EXPECTED)
+        for event, (action, button) in zip(events, _EXPECTED):
+            assert isinstance(event, Event)
+            assert event.action == action
+            assert event.button == button
         
         print("✓ Event parser integration test passed")
         return True
@@ -87,25 +90,28 @@ def test_event_parser_integration():
         return False
 
 
-def test_package_structure():
+def _check_package_structure():
     """Test that the package structure is correct."""
     base_path = Path(__file__).parent.parent / "src"
     
+    # One listing of src/ covers the main package and its subpackages
+    with os.scandir(base_path) as it:
+        entries = {entry.name: entry for entry in it}
+    
     # Check main package
-    assert (base_path / "__init__.py").exists()
+    assert entries["__init__.py"].is_file()
     
     # Check subpackages
-    subpackages = ["core", "platform", "analysis", "ui", "utils"]
+    subpackages = {"core", "platform", "analysis", "ui", "utils"}
+    assert subpackages <= {name for name, entry in entries.items() if entry.is_dir()}
     for subpackage in subpackages:
-        package_path = base_path / subpackage
-        assert package_path.exists()
-        assert (package_path / "__init__.py").exists()
+        assert os.path.isfile(os.path.join(entries[subpackage].path, "__init__.py"))
     
     print("✓ Package structure test passed")
     return True
 
 
-def test_automation_config():
+def _check_automation_config():
     """Test AutomationConfig creation and usage."""
     try:
         from src.core.automation_runner import AutomationConfig
@@ -132,7 +138,7 @@ def test_automation_config():
         return False
 
 
-def test_linux_environment_check():
+def _check_linux_environment_check():
     """Test Linux environment validation."""
     try:
         from src.platform.x11_automation import check_x11_dependencies, setup_linux_environment
@@ -152,7 +158,24 @@ def test_linux_environment_check():
         return False
 
 
-def test_main_package():
+def _check_find_process_by_name():
+    """Test process lookup by (partial, case-insensitive) name."""
+    try:
+        from src.platform.x11_automation import X11ProcessManager
+        
+        own_name = Path(f"/proc/{os.getpid()}/comm").read_text().strip()
+        pid = X11ProcessManager.find_process_by_name(own_name.upper())
+        assert pid is not None and X11ProcessManager.is_process_running(pid)
+        assert X11ProcessManager.find_process_by_name("no-such-process-xyz") is None
+        
+        print("✓ Process lookup test passed")
+        return True
+    except Exception as e:
+        print(f"✗ Process lookup test failed: {e}")
+        return False
+
+
+def _check_main_package():
     """Test that main package can be imported."""
     try:
         import src
@@ -165,47 +188,49 @@ def test_main_package():
         return False
 
 
-def main():
-    """Run all integration tests."""
-    print("Running integration tests for refactored grafika_differ package")
-    print("=" * 70)
-    
-    tests = [
-        test_package_structure,
-        test_main_package,
-        test_core_module_imports,
-        test_platform_module_imports,
-        test_analysis_module_imports,
-        test_ui_module_imports,
-        test_event_parser_integration,
-        test_automation_config,
-        test_linux_environment_check,
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 70)
-    print(f"Integration test results: {passed} passed, {failed} failed")
+@pytest.mark.parametrize(
+    "check",
+    [
+        _check_package_structure,
+        _check_main_package,
+        _check_core_module_imports,
+        _check_platform_module_imports,
+        _check_analysis_module_imports,
+        _check_ui_module_imports,
+        _check_event_parser_integration,
+        _check_automation_config,
+        _check_linux_environment_check,
+        pytest.param(
+            _check_find_process_by_name,
+            marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc"),
+        ),
+    ],
+    ids=lambda check: check.__name__[len("_check_"):],
+)
+def test_integration(check):
+    """Run one independent integration check; each returns True on success."""
+    assert check()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_find_long_process_name(tmp_path):
+    """Test lookup of a name part that /proc/<pid>/comm truncates away."""
+    from src.platform.x11_automation import X11ProcessManager
     
-    if failed == 0:
-        print("🎉 All integration tests passed! Refactoring successful!")
-    else:
-        print("⚠ Some integration tests failed. Please review the issues above.")
-    
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    # comm keeps only the first 15 characters: "grafika-long-pr"
+    launcher = tmp_path / "grafika-long-process-xyzzy"
+    launcher.symlink_to(sys.executable)
+    proc = subprocess.Popen(
+        [str(launcher), "-c", "import time; print(flush=True); time.sleep(30)"],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        # Wait until the child runs under its new name, then drop any scan
+        # cached by an earlier lookup
+        proc.stdout.readline()
+        X11ProcessManager._process_cache_time = float('-inf')
+        assert X11ProcessManager.find_process_by_name("xyzzy") == proc.pid
+    finally:
+        proc.kill()
+        proc.wait()
+        proc.stdout.close()
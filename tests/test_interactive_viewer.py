@@ -0,0 +1,179 @@
+"""
+Tests for the interactive viewer's display-free helpers.
+
+The viewer is built with ``__new__`` so no Tk window is created; only the
+state the composition helpers read is set up.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+viewer_module = pytest.importorskip("src.ui.interactive_viewer")
+np = pytest.importorskip("numpy")
+from PIL import Image, ImageChops
+
+InteractiveViewer = viewer_module.InteractiveViewer
+
+
+def _make_viewer(mode, scale=1.0):
+    """Return a viewer without a window whose canvas fit factor is ``scale``."""
+    viewer = InteractiveViewer.__new__(InteractiveViewer)
+    viewer.mode = mode
+    viewer.alpha = 0.5
+    viewer.split = 0.5
+    viewer.fit = True
+    viewer._fit_cache = OrderedDict()
+    viewer._preview = False
+    viewer._preview_used = False
+    viewer._compose_buf = {}
+    viewer._diff = None
+    viewer._fit_scale = lambda iw, ih: scale
+    return viewer
+
+
+def _pair(size=(40, 30)):
+    """Return two noise images of ``size`` with their arrays."""
+    rng = np.random.default_rng(0)
+    arr_a = rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    arr_b = rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    return Image.fromarray(arr_a), Image.fromarray(arr_b), arr_a, arr_b
+
+
+def _max_difference(image, reference):
+    return int(np.abs(np.asarray(image, dtype=np.int16) - np.asarray(reference, dtype=np.int16)).max())
+
+
+def test_side_by_side():
+    """Test that side-by-side places A and B next to each other."""
+    a, b, arr_a, arr_b = _pair()
+    reference = Image.new("RGB", (a.width * 2, a.height))
+    reference.paste(a, (0, 0))
+    reference.paste(b, (a.width, 0))
+    
+    out = _make_viewer(0)._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert out.size == reference.size
+    assert _max_difference(out, reference) == 0
+
+
+def test_side_by_side_fitted():
+    """Test that side-by-side halves are downscaled to their share of the canvas."""
+    a, b, arr_a, arr_b = _pair((40, 30))
+    out = _make_viewer(0, scale=0.5)._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert out.size == (40, 15)
+
+
+@pytest.mark.parametrize("alpha", [0.0, 0.25, 0.5, 0.95, 1.0])
+def test_overlay(alpha, monkeypatch):
+    """Test that the NumPy fixed-point blend matches Image.blend within 1 LSB."""
+    monkeypatch.setattr(viewer_module, "HAS_NUMBA", False)
+    a, b, arr_a, arr_b = _pair()
+    viewer = _make_viewer(1)
+    viewer.alpha = alpha
+    
+    out = viewer._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert out.size == a.size
+    assert _max_difference(out, Image.blend(a, b, alpha)) <= 1
+
+
+@pytest.mark.skipif(not viewer_module.HAS_NUMBA, reason="Numba unavailable")
+def test_parallel_blend_matches_numpy():
+    """Test that the Numba blend kernel gives the same pixels as the NumPy path."""
+    a, b, arr_a, arr_b = _pair()
+    viewer = _make_viewer(1)
+    viewer.alpha = 0.3
+    ai = int(viewer.alpha * 256)
+    
+    fallback = ((arr_a.astype(np.uint16) * (256 - ai) + arr_b.astype(np.uint16) * ai) >> 8).astype(np.uint8)
+    assert np.array_equal(viewer_module._blend_uint8(arr_a, arr_b, ai), fallback)
+
+
+@pytest.mark.parametrize("split", [0.0, 0.3, 0.5, 1.0])
+def test_split(split):
+    """Test that split shows A left of the divider and B right of it."""
+    a, b, arr_a, arr_b = _pair()
+    viewer = _make_viewer(2)
+    viewer.split = split
+    x = int(split * a.width)
+    reference = a.copy()
+    reference.paste(b.crop((x, 0, b.width, b.height)), (x, 0))
+    
+    out = viewer._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert _max_difference(out, reference) == 0
+
+
+def test_diff_computed():
+    """Test that diff mode without a diff file shows |a - b|."""
+    a, b, arr_a, arr_b = _pair()
+    out = _make_viewer(3)._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert _max_difference(out, ImageChops.difference(a, b)) == 0
+
+
+def test_diff_file():
+    """Test that diff mode shows the precomputed diff image when present."""
+    d, _b, arr_d, _arr_b = _pair()
+    out = _make_viewer(3)._compose("x.png", (None, None, d), (None, None, arr_d))
+    assert _max_difference(out, d) == 0
+
+
+def test_compose_reuses_buffers():
+    """Test that consecutive frames do not change an image already returned."""
+    a, b, arr_a, arr_b = _pair()
+    viewer = _make_viewer(2)
+    first = viewer._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    snapshot = np.asarray(first).copy()
+    viewer.split = 0.9
+    viewer._compose("x.png", (a, b, None), (arr_a, arr_b, None))
+    assert np.array_equal(np.asarray(first), snapshot)
+
+
+@pytest.mark.parametrize("size", [(400, 300), (199, 149), (100, 75), (50, 37), (37, 20), (800, 600)])
+def test_resample_sizes(size):
+    """Test that resampling hits the exact target size, with or without the reduce step."""
+    source = Image.effect_noise((400, 300), 40).convert("RGB")
+    assert InteractiveViewer._resample(source, size, Image.LANCZOS).size == size
+
+
+def test_load_image_decodes_outside_lock():
+    """Test that a decode in progress neither holds the lock nor is repeated."""
+    viewer = InteractiveViewer.__new__(InteractiveViewer)
+    viewer._decode_lock = threading.Lock()
+    viewer._decoded = OrderedDict()
+    viewer._decoding = {}
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    
+    def decode(name, role, draft_size):
+        calls.append((name, role))
+        if name == "x.png":
+            started.set()
+            release.wait(5)
+        return name, role
+    
+    viewer._decode_image = decode
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(viewer._load_image, "x.png", "a", None)
+        assert started.wait(5)
+        # Another key is served while the first decode is still running
+        assert viewer._load_image("y.png", "a", None) == ("y.png", "a")
+        second = pool.submit(viewer._load_image, "x.png", "a", None)
+        release.set()
+        assert first.result(5) == second.result(5) == ("x.png", "a")
+    assert calls == [("x.png", "a"), ("y.png", "a")]
+    assert not viewer._decoding
+
+
+def test_scan_png(tmp_path):
+    """Test that the PNG scan keeps what glob("*.png") matched, minus directories."""
+    for name in ("a.png", ".hidden.png", "notes.txt", "b.PNG"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "folder.png").mkdir()
+    os.symlink(tmp_path / "a.png", tmp_path / "link.png")
+    
+    found = viewer_module._scan_png(tmp_path)
+    assert set(found) == {"a.png", ".hidden.png", "link.png"}
+    assert found["a.png"] == os.path.join(tmp_path, "a.png")
@@ -0,0 +1,60 @@
+"""
+Tests for the MIT-SHM capture helper.
+"""
+
+import ctypes
+import ctypes.util
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux") or ctypes.util.find_library("X11") is None,
+    reason="libX11 unavailable",
+)
+
+
+def test_construction_without_display(monkeypatch):
+    """Test that ShmCapture fails cleanly and leaves the X error handler alone."""
+    from src.platform.x11_shm import ShmCapture, _ERROR_HANDLER
+    
+    xlib = ctypes.CDLL(ctypes.util.find_library("X11"))
+    xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+    xlib.XSetErrorHandler.restype = ctypes.c_void_p
+    
+    sentinel = _ERROR_HANDLER(lambda dpy, event: 0)
+    sentinel_address = ctypes.cast(sentinel, ctypes.c_void_p).value
+    original = xlib.XSetErrorHandler(sentinel_address)
+    try:
+        monkeypatch.delenv("DISPLAY", raising=False)
+        with pytest.raises(OSError):
+            ShmCapture()
+        
+        # Swap back to read the handler that is installed now
+        installed = xlib.XSetErrorHandler(original)
+        assert installed == sentinel_address
+    finally:
+        xlib.XSetErrorHandler(original)
+
+
+def test_error_trap_restores_previous_handler():
+    """Test that the error trap puts the previous handler back on exit."""
+    from src.platform.x11_shm import _ERROR_HANDLER, _trap_errors
+    
+    xlib = ctypes.CDLL(ctypes.util.find_library("X11"))
+    xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+    xlib.XSetErrorHandler.restype = ctypes.c_void_p
+    
+    sentinel = _ERROR_HANDLER(lambda dpy, event: 0)
+    sentinel_address = ctypes.cast(sentinel, ctypes.c_void_p).value
+    original = xlib.XSetErrorHandler(sentinel_address)
+    try:
+        with pytest.raises(RuntimeError):
+            with _trap_errors(xlib) as errors:
+                assert errors == []
+                raise RuntimeError("interrupted")
+        
+        installed = xlib.XSetErrorHandler(original)
+        assert installed == sentinel_address
+    finally:
+        xlib.XSetErrorHandler(original)